@@ -0,0 +1,113 @@
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Optional
+from BasePage import BasePage
+
+
+# Versión asyncio de BasePage. Cada llamada bloqueante de Selenium se ejecuta en un
+# executor acotado, así un solo event loop puede manejar muchas sesiones a la vez:
+#
+#   executor = ThreadPoolExecutor(max_workers=16)
+#   async def monitor(url):
+#       page = await AsyncBasePage.create(driver_to_use='chrome', headless=True, executor=executor)
+#       try:
+#           await page.navigate_to(url, timeout=30)
+#           return await page.get_title()
+#       finally:
+#           await page.close_browser()
+#   titles = await asyncio.gather(*(monitor(url) for url in urls))
+#
+# Las llamadas de una misma sesión se serializan (WebDriver no admite comandos
+# concurrentes sobre la misma sesión). Al cancelar o vencer el timeout la corrutina
+# termina enseguida, pero el comando que ya estaba en curso en el driver termina
+# en su thread y recién ahí se libera la sesión.
+class AsyncBasePage:
+
+    def __init__(self, page: BasePage, executor: Optional[Executor] = None, timeout: Optional[float] = None):
+        self.page = page
+        self.executor = executor
+        self.timeout = timeout
+        self._lock = asyncio.Lock()
+
+    # Crea el BasePage en el executor, sin bloquear el event loop. El browser se lanza
+    # recién con el primer comando (ver BasePage.driver), también en el executor.
+    @classmethod
+    async def create(cls, *args, executor: Optional[Executor] = None, timeout: Optional[float] = None,
+                     page_class: type = BasePage, **kwargs):
+        loop = asyncio.get_running_loop()
+        page = await loop.run_in_executor(executor, functools.partial(page_class, *args, **kwargs))
+        return cls(page, executor, timeout)
+
+    # Ejecuta cualquier método de BasePage en el executor, con timeout opcional.
+    async def call(self, name: str, *args, timeout: Optional[float] = None, **kwargs):
+        method = getattr(self.page, name)
+        timeout = self.timeout if timeout is None else timeout
+        return await asyncio.wait_for(self.__run(method, *args, **kwargs), timeout)
+
+    async def navigate_to(self, url: str, timeout: Optional[float] = None):
+        return await self.call('navigate_to', url, timeout=timeout)
+
+    async def find(self, locator: tuple, polling=None, timeout: Optional[float] = None):
+        return await self.call('find', locator, polling, timeout=timeout)
+
+    async def click_element(self, locator, timeout: Optional[float] = None):
+        return await self.call('click_element', locator, timeout=timeout)
+
+    async def set_text(self, locator, text_to_write, timeout: Optional[float] = None):
+        return await self.call('set_text', locator, text_to_write, timeout=timeout)
+
+    async def get_text(self, locator, timeout: Optional[float] = None):
+        return await self.call('get_text', locator, timeout=timeout)
+
+    async def get_title(self, timeout: Optional[float] = None):
+        return await self.call('get_title', timeout=timeout)
+
+    async def wait_until(self, condition, polling=None, locator=None, timeout: Optional[float] = None):
+        return await self.call('wait_until', condition, polling, locator, timeout=timeout)
+
+    async def visibility_of_element_located(self, locator, timeout: Optional[float] = None):
+        return await self.call('visibility_of_element_located', locator, timeout=timeout)
+
+    async def invisibility_of_element_located(self, locator, timeout: Optional[float] = None):
+        return await self.call('invisibility_of_element_located', locator, timeout=timeout)
+
+    async def wait_for_element_to_disappear(self, element, timeout: Optional[float] = None):
+        return await self.call('wait_for_element_to_disappear', element, timeout=timeout)
+
+    async def wait_for_element_to_be_clickable(self, element, timeout: Optional[float] = None):
+        return await self.call('wait_for_element_to_be_clickable', element, timeout=timeout)
+
+    async def close_browser(self, timeout: Optional[float] = None):
+        return await self.call('close_browser', timeout=timeout)
+
+    # El resto de los métodos de BasePage se exponen como corrutinas: await page.get_attribute(...)
+    def __getattr__(self, name: str):
+        if name.startswith('_') or name == 'page' or not callable(getattr(self.page, name, None)):
+            raise AttributeError(name)
+        return functools.partial(self.call, name)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close_browser()
+
+    # Método privado: ejecuta la llamada en el executor con la sesión tomada. La sesión
+    # se libera cuando termina el comando, aunque la corrutina se haya cancelado antes.
+    async def __run(self, method, *args, **kwargs):
+        await self._lock.acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, functools.partial(method, *args, **kwargs))
+        except BaseException:
+            self._lock.release()
+            raise
+        future.add_done_callback(self.__release)
+        return await asyncio.shield(future)
+
+    # Método privado: libera la sesión y consume la excepción de comandos abandonados.
+    def __release(self, future):
+        self._lock.release()
+        if not future.cancelled():
+            future.exception()
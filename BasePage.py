@@ -1,27 +1,368 @@
+from __future__ import annotations
 from io import BytesIO
-from PIL import Image
+import importlib
+import json
+from contextlib import contextmanager
 import os.path
+import threading
 from datetime import datetime
 import time
-from typing import Optional
-from selenium.webdriver.common.alert import Alert
-from selenium import webdriver
+import weakref
+from typing import Optional, TYPE_CHECKING
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as ec
-from selenium.webdriver.support.select import Select
-from selenium.webdriver import ActionChains
-from selenium.webdriver.chrome.service import Service as ChromeService  # ChromeService que se utiliza para iniciar el servicio de Chrome.
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import TimeoutException
 from selenium.common.exceptions import WebDriverException
-from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import NoSuchFrameException
+from selenium.common.exceptions import JavascriptException
+import Polling
+
+if TYPE_CHECKING:
+    from PIL import Image
+    from selenium.webdriver.remote.webelement import WebElement
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+# Módulo importado de forma diferida: se carga recién al usar uno de sus atributos.
+# Así importar BasePage no carga remote.webdriver ni el resto de Selenium. La carga
+# se hace con import_module bajo un lock (LazyLoader no es thread-safe y los page se
+# usan desde varios threads, ver AsyncBasePage y DriverPool).
+class _LazyModule:
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, attribute: str):
+        module = self._module
+        if module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+                module = self._module
+        return getattr(module, attribute)
+
+
+ec = _LazyModule('selenium.webdriver.support.expected_conditions')
+support_wait = _LazyModule('selenium.webdriver.support.wait')
+support_select = _LazyModule('selenium.webdriver.support.select')
+action_chains = _LazyModule('selenium.webdriver.common.action_chains')
+
 
 class BasePage(By):
     
     VALID_BROWSERS = {'chrome', 'firefox', 'edge'}
+    PAGE_LOAD_STRATEGIES = {'normal', 'eager', 'none'}
+
+    # Patrones de URL (formato de Network.setBlockedURLs) por tipo de recurso.
+    RESOURCE_PATTERNS = {
+        'image': ('*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp'),
+        'font': ('*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'),
+        'media': ('*.mp4', '*.webm', '*.mp3', '*.ogg', '*.wav', '*.m3u8'),
+        'stylesheet': ('*.css',),
+        'analytics': ('*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+                      '*facebook.net*', '*hotjar.com*', '*segment.io*', '*newrelic.com*'),
+    }
+    SNAPSHOT_FIELDS = ('displayed', 'enabled', 'checked', 'rect', 'color')
+
+    # Scripts registrados por CDP (Page.addScriptToEvaluateOnNewDocument) por driver.
+    # Sobreviven al page, por eso se quitan en reset_browser_state (ver DriverPool).
+    _cdp_scripts = weakref.WeakKeyDictionary()
+
+    # Página lista: documento cargado y sin recursos terminados en los últimos arguments[0] ms.
+    PAGE_READY_SCRIPT = """
+        if (document.readyState !== 'complete') { return false; }
+        var entries = performance.getEntriesByType('resource'), last = 0;
+        for (var i = 0; i < entries.length; i++) { last = Math.max(last, entries[i].responseEnd); }
+        return performance.now() - last >= arguments[0];
+    """
+
+    # Resuelve un locator (By, valor) dentro del documento; lo usan los scripts por lotes.
+    FIND_BY_SCRIPT = """
+        function findBy(by, value, root) {
+            root = root || document;
+            switch (by) {
+                case 'id': return document.getElementById(value);
+                case 'name': return root.querySelector('[name="' + CSS.escape(value) + '"]');
+                case 'class name': return root.querySelector('.' + CSS.escape(value));
+                case 'tag name': return root.querySelector(value);
+                case 'css selector': return root.querySelector(value);
+                case 'xpath':
+                    return document.evaluate(value, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                case 'link text':
+                case 'partial link text':
+                    var links = root.querySelectorAll('a');
+                    for (var i = 0; i < links.length; i++) {
+                        var text = links[i].innerText.trim();
+                        if (by === 'link text' ? text === value : text.indexOf(value) !== -1) { return links[i]; }
+                    }
+                    return null;
+            }
+            return null;
+        }
+    """
+
+    # Estado de varios elementos en una sola evaluación. arguments[0]: [[by, valor]],
+    # arguments[1]: campos. "displayed" es una aproximación del is_displayed de WebDriver.
+    SNAPSHOT_SCRIPT = FIND_BY_SCRIPT + """
+        var locators = arguments[0], fields = arguments[1], out = [];
+        for (var i = 0; i < locators.length; i++) {
+            var el = findBy(locators[i][0], locators[i][1]), info = {present: !!el};
+            if (el) {
+                var style = window.getComputedStyle(el);
+                for (var j = 0; j < fields.length; j++) {
+                    var field = fields[j];
+                    if (field === 'displayed') {
+                        info.displayed = el.getClientRects().length > 0 && style.visibility !== 'hidden'
+                            && style.display !== 'none' && style.opacity !== '0';
+                    } else if (field === 'enabled') {
+                        info.enabled = !el.matches(':disabled');
+                    } else if (field === 'checked') {
+                        info.checked = !!(el.checked || el.selected);
+                    } else if (field === 'rect' || field === 'size') {
+                        var r = el.getBoundingClientRect();
+                        info[field] = field === 'size' ? {height: r.height, width: r.width}
+                            : {height: r.height, width: r.width, x: r.left + window.scrollX, y: r.top + window.scrollY};
+                    } else if (field === 'text') {
+                        info.text = el.innerText;
+                    } else if (field === 'value') {
+                        info.value = el.value;
+                    } else if (field === 'color') {
+                        info.color = style.getPropertyValue('background-color');
+                    } else if (field.indexOf('css:') === 0) {
+                        info[field] = style.getPropertyValue(field.substring(4));
+                    }
+                }
+            }
+            out.push(info);
+        }
+        return out;
+    """
+
+    # Opciones de un select como datos planos: [{text, value, selected, index}].
+    DROPDOWN_OPTIONS_SCRIPT = """
+        var options = arguments[0].options, out = [];
+        for (var i = 0; i < options.length; i++) {
+            out.push({text: options[i].text, value: options[i].value, selected: options[i].selected, index: i});
+        }
+        return out;
+    """
+
+    # Selecciona en un select la opción cuyo arguments[1] ('text' o 'value') sea arguments[2]
+    # y dispara input/change. Devuelve false si la opción no existe.
+    DROPDOWN_SELECT_SCRIPT = """
+        var select = arguments[0], field = arguments[1], wanted = arguments[2], option = null;
+        if (field === 'value') {
+            var matches = select.querySelectorAll('option[value="' + CSS.escape(wanted) + '"]');
+            option = matches.length ? matches[0] : null;
+        } else {
+            for (var i = 0; i < select.options.length; i++) {
+                if (select.options[i].text === wanted) { option = select.options[i]; break; }
+            }
+        }
+        if (!option) { return false; }
+        option.selected = true;
+        select.dispatchEvent(new Event('input', {bubbles: true}));
+        select.dispatchEvent(new Event('change', {bubbles: true}));
+        return true;
+    """
+
+    # Requests y bytes transferidos según Resource Timing (incluye el documento).
+    NETWORK_STATS_SCRIPT = """
+        var entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+        var bytes = 0;
+        for (var i = 0; i < entries.length; i++) { bytes += entries[i].transferSize || 0; }
+        return {requests: entries.length, transferred_bytes: bytes};
+    """
+
+    # Lee url, origen, localStorage y sessionStorage de la página actual.
+    STORAGE_READ_SCRIPT = """
+        function dump(storage) {
+            var out = {};
+            for (var i = 0; i < storage.length; i++) { out[storage.key(i)] = storage.getItem(storage.key(i)); }
+            return out;
+        }
+        return {url: location.href, origin: location.origin,
+                local_storage: dump(window.localStorage), session_storage: dump(window.sessionStorage)};
+    """
+
+    # Carga arguments[0] en localStorage y arguments[1] en sessionStorage.
+    STORAGE_WRITE_SCRIPT = """
+        var local = arguments[0], session = arguments[1];
+        for (var key in local) { window.localStorage.setItem(key, local[key]); }
+        for (var key in session) { window.sessionStorage.setItem(key, session[key]); }
+    """
+
+    # Helpers JS para cargar inputs: setNative usa el setter nativo de value (compatible
+    # con frameworks que lo interceptan) y fire dispara input/change.
+    SET_VALUE_SCRIPT = """
+        function setNative(el, value) {
+            var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        }
+        function fire(el) {
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+    """
+
+    # Completa varios campos: arguments[0] es [[by, valor_locator, valor]] (ver SET_VALUE_SCRIPT).
+    # Devuelve por campo: 'ok', 'not_found', 'disabled', 'no_option', 'not_bool' o 'needs_keys'.
+    FILL_FORM_SCRIPT = FIND_BY_SCRIPT + SET_VALUE_SCRIPT + """
+        var fields = arguments[0], out = [];
+        for (var i = 0; i < fields.length; i++) {
+            var el = findBy(fields[i][0], fields[i][1]), value = fields[i][2];
+            if (!el) { out.push('not_found'); continue; }
+            if (el.matches(':disabled')) { out.push('disabled'); continue; }
+            var tag = el.tagName.toLowerCase(), type = (el.type || '').toLowerCase();
+            if (tag === 'select') {
+                var option = null;
+                for (var j = 0; j < el.options.length; j++) {
+                    if (el.options[j].value === String(value) || el.options[j].text === String(value)) { option = el.options[j]; break; }
+                }
+                if (!option) { out.push('no_option'); continue; }
+                option.selected = true;
+                fire(el);
+            } else if (type === 'checkbox' || type === 'radio') {
+                if (typeof value !== 'boolean') { out.push('not_bool'); continue; }
+                if (el.checked !== value) { el.checked = value; fire(el); }
+            } else if (type === 'file') {
+                out.push('needs_keys');
+                continue;
+            } else if (tag === 'input' || tag === 'textarea') {
+                el.focus();
+                setNative(el, String(value));
+                fire(el);
+                el.blur();
+            } else if (el.isContentEditable) {
+                el.textContent = String(value);
+                fire(el);
+            } else {
+                out.push('needs_keys');
+                continue;
+            }
+            out.push('ok');
+        }
+        return out;
+    """
+
+    # Tracker de actividad: cuenta fetch/XHR pendientes y timers de hasta 1 seg., y
+    # registra la última actividad (requests, timers o mutaciones del DOM).
+    IDLE_TRACKER_SCRIPT = """
+        (function () {
+            if (window.__basePageIdle) { return; }
+            var idle = window.__basePageIdle = {pending: 0, last: performance.now(), setTimeout: window.setTimeout};
+            function touch() { idle.last = performance.now(); }
+            function start() { idle.pending++; touch(); }
+            function end() { idle.pending = Math.max(0, idle.pending - 1); touch(); }
+            if (window.fetch) {
+                var fetch = window.fetch;
+                window.fetch = function () {
+                    start();
+                    return fetch.apply(this, arguments).then(
+                        function (response) { end(); return response; },
+                        function (error) { end(); throw error; });
+                };
+            }
+            var send = XMLHttpRequest.prototype.send;
+            XMLHttpRequest.prototype.send = function () {
+                start();
+                this.addEventListener('loadend', end);
+                return send.apply(this, arguments);
+            };
+            var timers = {}, setTimeout_ = window.setTimeout, clearTimeout_ = window.clearTimeout;
+            window.setTimeout = function (callback, delay) {
+                if (typeof callback !== 'function' || (delay || 0) > 1000) {
+                    return setTimeout_.apply(window, arguments);
+                }
+                var args = Array.prototype.slice.call(arguments, 2), id;
+                start();
+                id = setTimeout_(function () {
+                    delete timers[id];
+                    try { callback.apply(window, args); } finally { end(); }
+                }, delay);
+                timers[id] = true;
+                return id;
+            };
+            window.clearTimeout = function (id) {
+                if (timers[id]) { delete timers[id]; end(); }
+                return clearTimeout_(id);
+            };
+            var observe = function () {
+                new MutationObserver(touch).observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+            };
+            if (document.documentElement) { observe(); } else { document.addEventListener('DOMContentLoaded', observe); }
+        })();
+    """
+
+    # Se resuelve true cuando el documento está completo, no hay actividad pendiente y
+    # pasaron arguments[0] ms sin actividad; false al vencer arguments[1] ms.
+    IDLE_WAIT_SCRIPT = """
+        var quiet = arguments[0], budget = arguments[1], done = arguments[arguments.length - 1];
+        var started = performance.now(), idle = window.__basePageIdle;
+        (function check() {
+            var now = performance.now();
+            if (document.readyState === 'complete' && idle.pending === 0 && now - idle.last >= quiet) { return done(true); }
+            if (now - started >= budget) { return done(false); }
+            // setTimeout original, para que la propia espera no cuente como actividad.
+            idle.setTimeout.call(window, check, 25);
+        })();
+    """
+
+    # Espera dos animation frames para que el render se estabilice.
+    ANIMATION_FRAME_SCRIPT = """
+        var done = arguments[arguments.length - 1], finished = false;
+        function finish(result) { if (!finished) { finished = true; done(result); } }
+        // En una ventana oculta o minimizada requestAnimationFrame no corre: se corta a los arguments[0] ms.
+        setTimeout(function () { finish(false); }, arguments[0]);
+        requestAnimationFrame(function () { requestAnimationFrame(function () { finish(true); }); });
+    """
+
+    # Lee las filas [arguments[1], arguments[1] + arguments[2]) del tbody de la tabla.
+    TABLE_READ_SCRIPT = """
+        var el = arguments[0], start = arguments[1], count = arguments[2];
+        var table = el.tagName === 'TABLE' ? el : el.querySelector('table');
+        if (!table) { return null; }
+        var body = table.tBodies.length ? table.tBodies[0] : table;
+        var rows = body.rows, end = count == null ? rows.length : Math.min(rows.length, start + count);
+        var out = [];
+        for (var i = start; i < end; i++) {
+            var cells = rows[i].cells, row = [];
+            for (var j = 0; j < cells.length; j++) { row.push(cells[j].innerText.trim()); }
+            out.push(row);
+        }
+        return out;
+    """
+
+    # Escribe [fila, columna, texto] (0-based) en el input/textarea de cada celda con el
+    # setter nativo (ver SET_VALUE_SCRIPT), o en la celda si es contenteditable. Devuelve
+    # las celdas faltantes o no editables.
+    TABLE_WRITE_SCRIPT = SET_VALUE_SCRIPT + """
+        var el = arguments[0], cells = arguments[1], missing = [];
+        var table = el.tagName === 'TABLE' ? el : el.querySelector('table');
+        var body = table && (table.tBodies.length ? table.tBodies[0] : table);
+        for (var k = 0; k < cells.length; k++) {
+            var r = cells[k][0], c = cells[k][1], text = cells[k][2];
+            var row = body && body.rows[r], cell = row && row.cells[c];
+            if (!cell) { missing.push([r, c]); continue; }
+            var input = cell.querySelector('input, textarea');
+            if (input && !input.matches(':disabled')) {
+                input.focus();
+                setNative(input, text);
+                fire(input);
+                input.blur();
+            } else if (cell.isContentEditable) {
+                cell.textContent = text;
+                fire(cell);
+            } else {
+                missing.push([r, c]);
+            }
+        }
+        return missing;
+    """
+
     # Constructor
     def __init__(self, 
                  driver: Optional[WebDriver] = None,
@@ -31,61 +372,200 @@ class BasePage(By):
                  proxy: str = '', 
                  load_timeout_site: int = 120, 
                  headless: bool = False, 
-                 ignore_cert_errors: bool = True):
+                 ignore_cert_errors: bool = True,
+                 cache_elements: bool = False,
+                 screenshot_wait: float = 3,
+                 window_wait: float = 2,
+                 polling=None,
+                 page_load_strategy: str = 'normal',
+                 block_resources: tuple = (),
+                 block_url_patterns: tuple = (),
+                 wait_for_idle: bool = False,
+                 idle_quiet_ms: int = 300):
         
         driver_to_use = driver_to_use.lower()
         
         if driver_to_use not in self.VALID_BROWSERS:
             raise ValueError(f"Invalido 'driver_to_use': {driver_to_use}. solo se admite: {', '.join(self.VALID_BROWSERS)}.")
         
-        if driver is None:
-            if driver_to_use == 'firefox':
-                firefox_options = webdriver.FirefoxOptions()
-                if headless:
-                    firefox_options.add_argument("--headless")
-                if proxy:
-                    firefox_options.add_argument(f'--proxy-server={proxy}')
-                if ignore_cert_errors:
-                    firefox_options.set_preference("network.stricttransportsecurity.preloadlist", False)
-                    firefox_options.set_preference("security.enterprise_roots.enabled", True)
-                    firefox_options.set_preference("webdriver_accept_untrusted_certs", True)
-                    firefox_options.set_preference("webdriver_assume_untrusted_issuer", False)
-                self.driver = webdriver.Firefox(options=firefox_options, service=FirefoxService())
-                
-            elif driver_to_use == 'edge':
-                edge_options = webdriver.EdgeOptions()
-                edge_options.add_argument("--start-maximized")
-                if headless:
-                    edge_options.add_argument("--headless")
-                if proxy:
-                    edge_options.add_argument(f'--proxy-server={proxy}')
-                if ignore_cert_errors:
-                    edge_options.add_argument('--ignore-certificate-errors')
-                self.driver = webdriver.Edge(options=edge_options, service=EdgeService())
-                
-            else:  # 'chrome' por defecto
-                chrome_options = webdriver.ChromeOptions()
-                chrome_options.add_experimental_option("detach", True)
-                chrome_options.add_argument("disable-logging")
-                chrome_options.add_argument('--allow-running-insecure-content')
-                chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-                chrome_options.add_argument("--disable-extensions")
-                if headless:
-                    chrome_options.add_argument("--headless")
-                if proxy:
-                    chrome_options.add_argument(f'--proxy-server={proxy}')
-                if ignore_cert_errors:
-                    chrome_options.add_argument('--ignore-certificate-errors')
-                self.driver = webdriver.Chrome(options=chrome_options, service=ChromeService())
-                
-        else:
+        if page_load_strategy not in self.PAGE_LOAD_STRATEGIES:
+            raise ValueError(f"Invalido 'page_load_strategy': {page_load_strategy}. solo se admite: {', '.join(self.PAGE_LOAD_STRATEGIES)}.")
+        
+        unknown = set(block_resources) - set(self.RESOURCE_PATTERNS)
+        if unknown:
+            raise ValueError(f"Invalido 'block_resources': {', '.join(unknown)}. solo se admite: {', '.join(self.RESOURCE_PATTERNS)}.")
+        
+        # Si no se recibe un driver, el browser se crea recién en el primer comando (ver driver).
+        self._driver = None
+        self._wait = None
+        self._actions = None
+        self._batch = None
+        self.actions_performed = 0
+        self._driver_settings = (driver_to_use, headless, proxy, ignore_cert_errors,
+                                 page_load_strategy, tuple(block_resources))
+        self.load_timeout_site = load_timeout_site
+        self.page_load_strategy = page_load_strategy
+        # Recursos bloqueados (tipos de RESOURCE_PATTERNS y patrones de URL propios).
+        self.blocked_resources = tuple(block_resources)
+        self.blocked_url_patterns = tuple(block_url_patterns)
+        self.blocked_requests = 0
+        # Un driver recibido (externo o de un DriverPool) no es del page: si se cierra
+        # no se relanza otro browser en su lugar.
+        self._owns_driver = driver is None
+        if driver is not None:
             self.driver = driver
         
-        self.driver.set_page_load_timeout(load_timeout_site)
-        self.wait = WebDriverWait(self.driver, wait)
-        self.actions = ActionChains(self.driver)
+        self.wait_timeout = wait
+        # Política de polling por defecto: None usa WebDriverWait (0.5 seg.), o
+        # 'backoff' / 'observer' / una instancia de Polling (ver Polling.py).
+        self.polling = polling
         self.highlight = highlight
         self.highlight_script = "arguments[0].style.border='10px ridge #d92356'"
+        self.screenshot_dir = 'screenshots'
+        # Esperas máximas (seg.) antes de una captura y al cambiar de ventana.
+        self.screenshot_wait = screenshot_wait
+        self.window_wait = window_wait
+        # Si wait_for_idle está activo, navigate_to / refresh / click_element esperan a
+        # que la app quede quieta (ver wait_until_idle).
+        self.wait_for_idle = wait_for_idle
+        self.idle_quiet_ms = idle_quiet_ms
+        self._idle_tracker_registered = False
+        self._known_handles = []
+        # Cache opcional locator -> WebElement, por ventana/frame actual.
+        self.cache_elements = cache_elements
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._element_cache = {}
+        self._dropdown_cache = {}
+        self._window = None
+        self._frame_path = []
+        # Elementos iframe ya resueltos, por (ventana, frame padre, locator del iframe).
+        self._frame_elements = {}
+        self.context_switches = 0
+
+    # Driver del page. Se crea (lanzando el browser) en el primer acceso, salvo que
+    # el page haya recibido un driver que ya se cerró.
+    @property
+    def driver(self) -> WebDriver:
+        if self._driver is None:
+            if not self._owns_driver:
+                raise WebDriverException("El driver recibido por el page fue cerrado; asigne uno nuevo con page.driver = ...")
+            self.driver = self.create_driver(*self._driver_settings)
+            self._owns_driver = True
+        return self._driver
+
+    # Asignar un driver lo marca como externo (ver owns_driver).
+    @driver.setter
+    def driver(self, driver: WebDriver):
+        driver.set_page_load_timeout(self.load_timeout_site)
+        self._driver = driver
+        self._owns_driver = False
+        self._wait = None
+        self._actions = None
+        if self.blocked_resources or self.blocked_url_patterns:
+            self.__apply_resource_blocking()
+
+    # Indica si el browser ya fue creado.
+    def has_driver(self) -> bool:
+        return self._driver is not None
+
+    # Indica si el browser lo creó el page (y por lo tanto puede cerrarlo y relanzarlo).
+    def owns_driver(self) -> bool:
+        return self._owns_driver
+
+    @property
+    def wait(self):
+        if self._wait is None:
+            self._wait = support_wait.WebDriverWait(self.driver, self.wait_timeout)
+        return self._wait
+
+    @property
+    def actions(self):
+        if self._actions is None:
+            self._actions = action_chains.ActionChains(self.driver)
+        return self._actions
+
+    # Deshace el estado que los page dejan en el browser (Chrome/Edge): los scripts
+    # registrados por CDP y el bloqueo de recursos. Lo usa DriverPool entre préstamos.
+    @classmethod
+    def reset_browser_state(cls, driver: WebDriver):
+        if not hasattr(driver, 'execute_cdp_cmd'):
+            return
+        for identifier in cls._cdp_scripts.pop(driver, []):
+            driver.execute_cdp_cmd('Page.removeScriptToEvaluateOnNewDocument', {'identifier': identifier})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+
+    # Crea una nueva instancia de WebDriver para el browser indicado. Se usa desde el
+    # constructor y desde DriverPool para reutilizar la misma configuración.
+    @classmethod
+    def create_driver(cls,
+                      driver_to_use: str = 'chrome',
+                      headless: bool = False,
+                      proxy: str = '',
+                      ignore_cert_errors: bool = True,
+                      page_load_strategy: str = 'normal',
+                      block_resources: tuple = ()) -> WebDriver:
+        driver_to_use = driver_to_use.lower()
+        if driver_to_use not in cls.VALID_BROWSERS:
+            raise ValueError(f"Invalido 'driver_to_use': {driver_to_use}. solo se admite: {', '.join(cls.VALID_BROWSERS)}.")
+
+        # Los módulos de cada browser se importan solo al crear el driver.
+        from selenium import webdriver
+
+        if driver_to_use == 'firefox':
+            from selenium.webdriver.firefox.service import Service as FirefoxService
+            firefox_options = webdriver.FirefoxOptions()
+            if headless:
+                firefox_options.add_argument("--headless")
+            if proxy:
+                firefox_options.add_argument(f'--proxy-server={proxy}')
+            if ignore_cert_errors:
+                firefox_options.set_preference("network.stricttransportsecurity.preloadlist", False)
+                firefox_options.set_preference("security.enterprise_roots.enabled", True)
+                firefox_options.set_preference("webdriver_accept_untrusted_certs", True)
+                firefox_options.set_preference("webdriver_assume_untrusted_issuer", False)
+            # Firefox no tiene Network.setBlockedURLs: imágenes y media se bloquean con preferencias.
+            if 'image' in block_resources:
+                firefox_options.set_preference("permissions.default.image", 2)
+            if 'media' in block_resources:
+                firefox_options.set_preference("media.autoplay.default", 5)
+            firefox_options.page_load_strategy = page_load_strategy
+            return webdriver.Firefox(options=firefox_options, service=FirefoxService())
+            
+        elif driver_to_use == 'edge':
+            from selenium.webdriver.edge.service import Service as EdgeService
+            edge_options = webdriver.EdgeOptions()
+            edge_options.add_argument("--start-maximized")
+            if headless:
+                edge_options.add_argument("--headless")
+            if proxy:
+                edge_options.add_argument(f'--proxy-server={proxy}')
+            if ignore_cert_errors:
+                edge_options.add_argument('--ignore-certificate-errors')
+            if block_resources:
+                edge_options.set_capability('ms:loggingPrefs', {'performance': 'ALL'})
+            edge_options.page_load_strategy = page_load_strategy
+            return webdriver.Edge(options=edge_options, service=EdgeService())
+            
+        else:  # 'chrome' por defecto
+            from selenium.webdriver.chrome.service import Service as ChromeService  # ChromeService que se utiliza para iniciar el servicio de Chrome.
+            chrome_options = webdriver.ChromeOptions()
+            chrome_options.add_experimental_option("detach", True)
+            chrome_options.add_argument("disable-logging")
+            chrome_options.add_argument('--allow-running-insecure-content')
+            chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+            chrome_options.add_argument("--disable-extensions")
+            if headless:
+                chrome_options.add_argument("--headless")
+            if proxy:
+                chrome_options.add_argument(f'--proxy-server={proxy}')
+            if ignore_cert_errors:
+                chrome_options.add_argument('--ignore-certificate-errors')
+            if block_resources:
+                # El log de performance permite contar los requests bloqueados.
+                chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            chrome_options.page_load_strategy = page_load_strategy
+            return webdriver.Chrome(options=chrome_options, service=ChromeService())
 
     # Obtiene el driver actual.
     def get_driver_current(self):
@@ -96,28 +576,107 @@ class BasePage(By):
         return self.driver.title
 
     # Abre el sitio web o archivo html.
-    def navigate_to(self, url:str):
+    # Con page_load_strategy='none' driver.get vuelve enseguida, así que se espera a
+    # que el documento sea interactivo (igual que 'eager').
+    def navigate_to(self, url:str, wait_idle: Optional[bool] = None):
+        self.clear_element_cache()
+        self.__reset_frame_context()
         try:
+            if self.__should_wait_idle(wait_idle):
+                self.enable_idle_tracking()
             self.driver.get(url)
+            if self.page_load_strategy == 'none':
+                self.wait_for_ready_state('interactive')
+            if self.__should_wait_idle(wait_idle):
+                self.__wait_idle()
   
         except WebDriverException as e:
             print(f"Error al navegar a la URL: {url}. más detalle: {e}")
             # traceback.print_exc()  # Imprime el rastro de la pila
-            self.driver.quit()
+            # Un driver recibido (por ej. de un DriverPool) lo cierra quien lo creó.
+            if self._owns_driver:
+                self.close_browser()
+
+    # Espera a que document.readyState llegue a 'interactive' o 'complete'.
+    def wait_for_ready_state(self, state: str = 'complete', timeout: Optional[float] = None) -> bool:
+        states = ('interactive', 'complete') if state == 'interactive' else ('complete',)
+        try:
+            support_wait.WebDriverWait(self.driver, self.load_timeout_site if timeout is None else timeout,
+                                       poll_frequency=0.05).until(
+                lambda driver: driver.execute_script('return document.readyState') in states)
+            return True
+        except TimeoutException:
+            return False
+
+    # Bloquea tipos de recursos (claves de RESOURCE_PATTERNS) y patrones de URL para
+    # las próximas navegaciones. En Chrome/Edge usa CDP Network.setBlockedURLs; en
+    # Firefox solo se pueden bloquear imágenes y media al crear el driver (para
+    # patrones de URL usar un proxy local con el parámetro proxy).
+    def block_resources(self, resource_types: tuple = (), url_patterns: tuple = ()) -> bool:
+        unknown = set(resource_types) - set(self.RESOURCE_PATTERNS)
+        if unknown:
+            raise ValueError(f"Invalido 'resource_types': {', '.join(unknown)}. solo se admite: {', '.join(self.RESOURCE_PATTERNS)}.")
+        self.blocked_resources = tuple(resource_types)
+        self.blocked_url_patterns = tuple(url_patterns)
+        if self.has_driver():
+            return self.__apply_resource_blocking()
+        return True
 
-    # Cierra el browser activo.
+    # Devuelve los requests y bytes transferidos por la página actual (Resource Timing)
+    # y los requests bloqueados acumulados (solo Chrome/Edge).
+    def get_network_stats(self) -> dict:
+        stats = self.driver.execute_script(self.NETWORK_STATS_SCRIPT)
+        try:
+            for entry in self.driver.get_log('performance'):
+                if '"Network.loadingFailed"' in entry['message'] and 'blockedReason' in entry['message']:
+                    self.blocked_requests += 1
+        except (WebDriverException, AttributeError, ValueError):
+            pass
+        stats['blocked_requests'] = self.blocked_requests
+        return stats
+
+    # Cierra el browser activo. Cada paso puede fallar (browser colgado o ya cerrado),
+    # así que se intentan todos y al final se matan los procesos del driver y del
+    # browser que sigan vivos, para no dejar procesos huérfanos en sesiones largas.
     def close_browser(self):
-        self.driver.stop_client()
-        # quit() method quits the driver instance, closing every associated window, which is opened.
-        self.driver.close()
-        self.driver.quit()
+        if not self.has_driver():
+            return
+        from SessionHealth import kill_processes, process_tree, service_pid
+        driver = self._driver
+        pid = service_pid(driver)
+        processes = process_tree(pid) if pid is not None else []
+        for step in ('stop_client', 'close', 'quit'):
+            try:
+                getattr(driver, step)()
+            except Exception as e:
+                print(f"Error al cerrar el browser ({step}). más detalle: {e}")
+        if processes:
+            kill_processes(processes)
+        self._driver = None
+        self._wait = None
+        self._actions = None
+        self._known_handles = []
+        self._window = None
+        self._idle_tracker_registered = False
+        self.clear_element_cache()
+        self.__reset_frame_context()
 
     # La funcion "find" devuelve un webElement en base al "locator" recibido.
-    def find(self, locator: tuple) -> WebElement:
+    # Si cache_elements está activo, primero revalida el elemento cacheado con un
+    # solo is_displayed() en vez de reiniciar todo el WebDriverWait.
+    # polling permite elegir la política de espera para esta llamada.
+    def find(self, locator: tuple, polling=None) -> WebElement:
+        locator = self.__enter_context(locator)
+        if self.cache_elements:
+            element = self.__get_cached_element(locator)
+            if element is not None:
+                return element
         try:
             # element = self.wait.until(ec.presence_of_element_located(locator))  # espera que esté presente
-            element = self.wait.until(ec.visibility_of_element_located(locator))  # espera que esté visible
+            element = self.wait_until(ec.visibility_of_element_located(locator), polling, locator)  # espera que esté visible
             # element = self.wait.until(ec.element_to_be_clickable(locator))  # espera que sea clickable
+            if self.cache_elements:
+                self._element_cache[self.__cache_key(locator)] = element
             if self.highlight:
                 self.driver.execute_script(self.highlight_script, element)
             return element
@@ -128,6 +687,24 @@ class BasePage(By):
             # Aquí manejas el caso cuando el elemento no es visible dentro del tiempo máximo de espera
             return None  # Otra opción es retornar None en caso de error
 
+    # Espera una condición usando la política de polling indicada (o la del page).
+    # locator es opcional y permite a la política 'observer' esperar del lado del browser.
+    def wait_until(self, condition, polling=None, locator=None):
+        policy = polling if polling is not None else self.polling
+        if policy is None:
+            return self.wait.until(condition)
+        return Polling.wait(policy, self, condition, self.wait_timeout, locator)
+
+    # Vacía el cache de elementos y de opciones de dropdowns (navegación, refresh,
+    # cambio de frame o ventana).
+    def clear_element_cache(self):
+        self._element_cache.clear()
+        self._dropdown_cache.clear()
+
+    # Devuelve los contadores del cache de elementos.
+    def get_cache_stats(self) -> dict:
+        return {'hits': self.cache_hits, 'misses': self.cache_misses, 'size': len(self._element_cache)}
+
     # La funcion "limpia" un textbox.
     def clear_text(self, locator):
         element = self.find(locator)
@@ -142,9 +719,9 @@ class BasePage(By):
 
     # La funcion inserta texto en un textbox.
     def set_text(self, locator, text_to_write):
-        self.clear_text(locator)
         element = self.find(locator)
         if element is not None:
+            element.clear()
             element.send_keys(text_to_write)
 
     # La función click_element_js en tu código se utiliza para hacer clic en un
@@ -155,12 +732,17 @@ class BasePage(By):
 
     # La función click_element en tu código se utiliza para hacer clic en un
     # elemento web identificado por un locator específico. 
-    def click_element(self, locator):
+    def click_element(self, locator, wait_idle: Optional[bool] = None):
         element = self.find(locator)
         if element is not None:
+            # El tracker se instala antes del click para contar los requests que dispare.
+            if self.__should_wait_idle(wait_idle):
+                self.enable_idle_tracking()
             element.click()
             if self.highlight:
                 self.driver.execute_script(self.highlight_script, element)
+            if self.__should_wait_idle(wait_idle):
+                self.__wait_idle()
 
     # Esta función devuelve la URL actual de la página
     # web que se está mostrando en el navegador.
@@ -184,16 +766,70 @@ class BasePage(By):
 
     # La función switch_to_window en tu código permite cambiar el enfoque a una
     # ventana específica en una aplicación web.
+    # En vez de un sleep fijo espera (hasta window_wait seg.) a que exista la ventana
+    # pedida; con índices negativos, si la ventana pedida es la actual, espera a que
+    # aparezca una ventana nueva (por ej. el popup que abre un click).
     def switch_to_window(self, window_number):
-        # self.wait.until(ec.number_of_windows_to_be(2))
-        self.sleep(2)
+        self.wait_for_window(window_number)
         try:
             self.driver.switch_to.window(self.driver.window_handles[window_number])
+            self._known_handles = self.driver.window_handles
+            self._window = window_number
+            self._frame_path = []
+            self._frame_elements.clear()
+            self.context_switches += 1
+            self.clear_element_cache()
         except IndexError as err:
             print(f'\n\n##############\nNo existe la ventana "{window_number}":', err, '\n##############\n')
         except Exception as err:
             print('\n\n##############\nSalió por error general:', err, '\n##############\n')
 
+    # Espera a que exista la ventana window_number. Con índices negativos, si esa
+    # ventana es la actual se espera una ventana nueva; si ya existe otra (por ej. al
+    # volver a un popup ya visitado) no se espera. Devuelve False si se agotó el tiempo.
+    def wait_for_window(self, window_number, timeout: Optional[float] = None) -> bool:
+        known = set(self._known_handles)
+        current = None
+        if window_number < 0:
+            try:
+                current = self.driver.current_window_handle
+            except WebDriverException:
+                pass
+            # Sin un switch previo, la única ventana conocida es la actual.
+            if not known and current is not None:
+                known = {current}
+
+        def window_available(driver):
+            handles = driver.window_handles
+            if window_number >= 0:
+                return len(handles) > window_number
+            if len(handles) < -window_number:
+                return False
+            if handles[window_number] != current:
+                return True
+            return any(h not in known for h in handles)
+
+        try:
+            support_wait.WebDriverWait(self.driver, self.window_wait if timeout is None else timeout,
+                          poll_frequency=0.05).until(window_available)
+            return True
+        except TimeoutException:
+            return False
+
+    # Espera (hasta screenshot_wait seg.) a que la página esté lista para una captura:
+    # document.readyState completo, red quieta durante quiet_ms y render estable.
+    # Devuelve False si se agotó el tiempo; la captura se toma igual.
+    def wait_for_page_ready(self, timeout: Optional[float] = None, quiet_ms: int = 300) -> bool:
+        timeout = self.screenshot_wait if timeout is None else timeout
+        end = time.monotonic() + timeout
+        try:
+            support_wait.WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                lambda driver: driver.execute_script(self.PAGE_READY_SCRIPT, quiet_ms))
+            remaining_ms = max(0, int((end - time.monotonic()) * 1000))
+            return bool(self.driver.execute_async_script(self.ANIMATION_FRAME_SCRIPT, remaining_ms))
+        except WebDriverException:
+            return False
+
     # La función scroll_down en tu código permite desplazar la página hacia abajo
     # en la cantidad de píxeles especificados.
     def scroll_down(self, pixels):
@@ -207,40 +843,67 @@ class BasePage(By):
     # por un locator quede visible en la ventana del navegador.
     def scroll_to_element(self, locator):
         element = self.find(locator)
-        self.actions.move_to_element(element).perform()
+        self.__perform(self.__action_chain().move_to_element(element))
         # self.driver.execute_script("arguments[0].scrollIntoView();", element)
 
     # La función double_click se utiliza para realizar un doble clic sobre un
     # elemento web identificado por un locator específico.
     def double_click(self, locator):
         element = self.find(locator)
-        self.actions.double_click(element).perform()
+        self.__perform(self.__action_chain().double_click(element))
 
     # La función right_click se utiliza para realizar un clic derecho en un
     # elemento web identificado por un locator específico.
     def right_click(self, locator):
         element = self.find(locator)
-        self.actions.context_click(element).perform()
+        self.__perform(self.__action_chain().context_click(element))
+
+    # Agrupa las acciones de mouse (scroll_to_element, double_click, right_click,
+    # click_and_hold, release, drag_and_drop, hover_over_element) y las envía juntas
+    # en un único request W3C Actions al salir del bloque:
+    #   with page.actions_batch():
+    #       page.hover_over_element(menu)
+    #       page.drag_and_drop(origen, destino)
+    # Si el bloque termina con una excepción las acciones se descartan.
+    @contextmanager
+    def actions_batch(self):
+        if self._batch is not None:
+            yield self._batch
+            return
+        # Las acciones quedan solo en la cadena local hasta el perform; si hay un error
+        # basta con descartarla (reset_actions liberaría en el browser botones presionados).
+        batch = self._batch = action_chains.ActionChains(self.driver)
+        try:
+            yield batch
+        finally:
+            self._batch = None
+        self.__perform(batch)
 
     # La función take_screenshot se utiliza para capturar una captura de pantalla de la página web actual en el
     # navegador y guardarla en un archivo con un título específico.
     def take_screenshot(self, title: str) -> str:
-        self.sleep(3)
+        self.wait_for_page_ready()
         date = datetime.now().strftime('%Y%m%d_%H%M%S')
-        if not os.path.exists(os.path.join(os.getcwd(), 'screenshots')):
-            os.mkdir('screenshots')
-        save_path:str = 'screenshots/' + title + '_' + date + '.png'
+        if not os.path.exists(self.screenshot_dir):
+            os.makedirs(self.screenshot_dir)
+        save_path:str = os.path.join(self.screenshot_dir, title + '_' + date + '.png')
         if self.driver.save_screenshot(save_path) == True:
              return save_path
         else:
              return None
     
+    # Igual que take_screenshot pero la recompresión y escritura a disco se hacen en
+    # segundo plano (ver ScreenshotPipeline). Devuelve un Future con la ruta del archivo.
+    def take_screenshot_async(self, title: str, pipeline):
+        self.wait_for_page_ready()
+        return pipeline.capture(self, title)
+
     #  La funcion devuleve un array de bytes, es útil cuando se utiliza:
     #  from pytest_html_reporter import attach
     #  from PIL import Image
     #  img = Image.open('D:/MisProyectos/Selenium/test/imagen.png')
     #  attach(get_screenshot_from_file(img))
-    def get_screenshot_from_file(self,img: Image) -> bytes:
+    def get_screenshot_from_file(self,img: Image.Image) -> bytes:
         # Guarda la imagen en un objeto BytesIO en formato PNG
         with BytesIO() as buffer:
             img.save(buffer, format='PNG')
@@ -249,20 +912,22 @@ class BasePage(By):
         return img_data
         
     def get_screenshot_as_png(self) -> bytes:
-        self.sleep(3)
+        self.wait_for_page_ready()
         return self.driver.get_screenshot_as_png()
            
     # La función click_and_hold se utiliza para hacer clic y mantener presionado un
     # elemento web identificado por un localizador
     def click_and_hold(self, locator):
-        element = self.wait.until(ec.element_to_be_clickable(locator))
-        self.actions.click_and_hold(element).perform()
+        locator = self.__enter_context(locator)
+        element = self.wait_until(ec.element_to_be_clickable(locator), locator=locator)
+        self.__perform(self.__action_chain().click_and_hold(element))
 
     # Libera la accion de un elemento. Esto podría ser útil, por ejemplo, en
     # una situación en la que necesitas arrastrar y soltar un elemento en una página web.
     def release(self, locator):
-        element = self.wait.until(ec.element_to_be_clickable(locator))
-        self.actions.release(element).perform()
+        locator = self.__enter_context(locator)
+        element = self.wait_until(ec.element_to_be_clickable(locator), locator=locator)
+        self.__perform(self.__action_chain().release(element))
 
     # la función está diseñada para ingresar un valor en una celda
     # editable de una tabla HTML
@@ -285,22 +950,154 @@ class BasePage(By):
             # Código a ejecutar si el locator no coincide con ningún caso anterior
             print("El locator no es By.XPATH.")
 
+    # Devuelve el contenido de la tabla (tbody) como una lista de filas, cada fila
+    # una lista con el texto de sus celdas. Se resuelve en un solo execute_script
+    # en vez de un find() + .text por celda. El locator puede apuntar a la tabla o
+    # a su contenedor (igual que get_value_from_table). start_row es 1-based.
+    def get_table(self, locator, start_row: int = 1, max_rows: Optional[int] = None) -> list:
+        element = self.find(locator)
+        if element is None:
+            return []
+        rows = self.driver.execute_script(self.TABLE_READ_SCRIPT, element, start_row - 1, max_rows)
+        return rows if rows is not None else []
+
+    # Recorre una tabla grande en bloques de chunk_size filas, para que cada
+    # respuesta JSON del driver quede acotada. Devuelve un generador de filas.
+    def iter_table_rows(self, locator, chunk_size: int = 200):
+        element = self.find(locator)
+        if element is None:
+            return
+        start = 0
+        while True:
+            rows = self.driver.execute_script(self.TABLE_READ_SCRIPT, element, start, chunk_size)
+            if not rows:
+                return
+            for row in rows:
+                yield row
+            if len(rows) < chunk_size:
+                return
+            start += chunk_size
+
+    # Ingresa varios valores en celdas de una tabla en un solo execute_script.
+    # values es un dict {(fila, columna): texto} con índices 1-based, igual que
+    # set_value_on_table. Devuelve la lista de (fila, columna) que no se pudieron cargar:
+    # no existen, o no tienen un input/textarea habilitado ni son contenteditable.
+    def set_table_values(self, locator, values: dict) -> list:
+        element = self.find(locator)
+        if element is None:
+            return list(values.keys())
+        cells = [[row - 1, column - 1, str(text)] for (row, column), text in values.items()]
+        missing = self.driver.execute_script(self.TABLE_WRITE_SCRIPT, element, cells)
+        return [(row + 1, column + 1) for row, column in (missing or [])]
+
     # Esta función cambia el contexto actual al marco (frame) principal o
     # al marco "padre" si actualmente estás dentro de un marco. Es útil 
     # cuando has cambiado al contexto de un marco secundario y deseas volver 
     # al marco principal de la página web.
     def switch_to_parent_frame(self):
         self.driver.switch_to.parent_frame()
+        self.context_switches += 1
+        if self._frame_path:
+            self._frame_path.pop()
+        self.clear_element_cache()
+
+    # Vuelve al documento principal de la ventana actual.
+    def switch_to_default_content(self):
+        self.driver.switch_to.default_content()
+        self.context_switches += 1
+        self._frame_path = []
+        self.clear_element_cache()
 
     # cambia el contexto al marco especificado en el argumento locator. Debes proporcionar un localizador
     # que identifique el marco al que deseas cambiar.
     def switch_to_frame(self, locator):
-        iframe = self.find(locator)
-        self.driver.switch_to.frame(iframe)
+        key = (self._window, tuple(self._frame_path), tuple(locator))
+        iframe = self._frame_elements.get(key)
+        try:
+            if iframe is None:
+                raise NoSuchFrameException()
+            self.driver.switch_to.frame(iframe)
+        except (StaleElementReferenceException, NoSuchFrameException):
+            iframe = self.find(locator)
+            self.driver.switch_to.frame(iframe)
+            self._frame_elements[key] = iframe
+        self.context_switches += 1
+        self._frame_path.append(tuple(locator))
+        self.clear_element_cache()
+
+    # Arma un locator que además indica en qué iframes (del más externo al más interno)
+    # y en qué ventana está el elemento. find() y las esperas cambian solo al contexto
+    # necesario, partiendo del contexto actual:
+    #   Pagar = BasePage.in_context((By.ID, 'pagar'), (By.ID, 'checkout'), (By.NAME, 'tarjeta'))
+    @staticmethod
+    def in_context(locator, *frames, window: Optional[int] = None) -> tuple:
+        return locator[0], locator[1], (window, tuple(tuple(frame) for frame in frames))
+
+    # Cambia a la ventana y cadena de iframes indicadas emitiendo solo los cambios
+    # necesarios: sube hasta el ancestro común y entra a los frames que faltan.
+    def switch_to_context(self, frames: tuple = (), window: Optional[int] = None):
+        if window is not None and window != self._window:
+            self.switch_to_window(window)
+        frames = [tuple(frame) for frame in frames]
+        common = 0
+        while (common < len(frames) and common < len(self._frame_path)
+               and frames[common] == self._frame_path[common]):
+            common += 1
+        if common == 0 and self._frame_path:
+            self.switch_to_default_content()
+        else:
+            while len(self._frame_path) > common:
+                self.switch_to_parent_frame()
+        for frame in frames[common:]:
+            self.switch_to_frame(frame)
 
     # Se utiliza para actualizar la página actual en el navegador web.
-    def refresh(self):
+    def refresh(self, wait_idle: Optional[bool] = None):
+        self.clear_element_cache()
+        self.__reset_frame_context()
+        if self.__should_wait_idle(wait_idle):
+            self.enable_idle_tracking()
         self.driver.refresh()
+        if self.__should_wait_idle(wait_idle):
+            self.__wait_idle()
+
+    # Registra el tracker de actividad (fetch/XHR pendientes, timers cortos y mutaciones
+    # del DOM). En Chrome/Edge se registra por CDP para que corra antes que los scripts
+    # de cada documento nuevo; además se instala en el documento actual.
+    def enable_idle_tracking(self):
+        if not self._idle_tracker_registered and hasattr(self.driver, 'execute_cdp_cmd'):
+            try:
+                result = self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument',
+                                                     {'source': self.IDLE_TRACKER_SCRIPT})
+                BasePage._cdp_scripts.setdefault(self.driver, []).append(result['identifier'])
+                self._idle_tracker_registered = True
+            except WebDriverException:
+                pass
+        try:
+            self.driver.execute_script(self.IDLE_TRACKER_SCRIPT)
+        except WebDriverException:
+            pass
+
+    # Espera a que no haya requests ni timers cortos pendientes y que el DOM no cambie
+    # durante quiet_ms. Devuelve False si se agotó el timeout (seg.).
+    def wait_until_idle(self, quiet_ms: Optional[int] = None, timeout: Optional[float] = None) -> bool:
+        quiet_ms = self.idle_quiet_ms if quiet_ms is None else quiet_ms
+        timeout = self.wait_timeout if timeout is None else timeout
+        end = time.monotonic() + timeout
+        while True:
+            remaining = end - time.monotonic()
+            # Cada script espera como máximo 25 seg. (el script timeout por defecto es 30).
+            budget = max(0, min(remaining, 25))
+            try:
+                if self.driver.execute_async_script(self.IDLE_TRACKER_SCRIPT + self.IDLE_WAIT_SCRIPT,
+                                                    quiet_ms, int(budget * 1000)):
+                    return True
+            except (JavascriptException, TimeoutException):
+                # La página navegó durante la espera (o venció el script): se vuelve a
+                # instalar el tracker. Otros errores (ventana o sesión cerrada) se propagan.
+                time.sleep(0.05)
+            if time.monotonic() >= end:
+                return False
 
     # se utiliza para aceptar (confirmar) una ventana emergente de alerta en una página web.
     def accept_alert(self):
@@ -353,12 +1150,12 @@ class BasePage(By):
 
     # devuelve la cantidad de items de un combo (select html)
     def get_dropdown_item_count(self, locator):
-        select = Select(self.find(locator))
+        select = support_select.Select(self.find(locator))
         return len(select.options)
 
     # devuelve los valores de un combo (select html)
     def get_all_dropdown_elements_list(self, locator):
-        select = Select(self.find(locator))
+        select = support_select.Select(self.find(locator))
         list_item = []
         for item in select.options:
             list_item.append(item)
@@ -366,30 +1163,119 @@ class BasePage(By):
 
     # devuelve los valores seleccionados de un combo (select multiple html)
     def get_dropdown_selected_item_list(self, locator):
-        select = Select(self.find(locator))
+        select = support_select.Select(self.find(locator))
         list_item = []
         for item in select.all_selected_options:
             list_item.append(item)
         return list_item
 
     # Selecciona el texto informado de una lista select x texto.
-    def select_element_of_list_by_text(self, locator, text):
-        select = Select(self.find(locator))
+    # Con use_js=True se selecciona en un solo execute_script sin recorrer las opciones
+    # desde Python; devuelve False si el texto no existe.
+    def select_element_of_list_by_text(self, locator, text, use_js: bool = False):
+        if use_js:
+            return self.__select_option_js(locator, 'text', text)
+        select = support_select.Select(self.find(locator))
         select.select_by_visible_text(text)
 
+    # Selecciona la opción de una lista select x value, vía JS (sin recorrer opciones).
+    # Devuelve False si el value no existe.
+    def select_element_of_list_by_value(self, locator, value) -> bool:
+        return self.__select_option_js(locator, 'value', value)
+
     # Selecciona el texto informado de una lista select x index.
     def select_element_of_list_by_index(self, locator, index):
-        select = Select(self.find(locator))
+        select = support_select.Select(self.find(locator))
         select.select_by_index(index)
 
     # Valida la existencia de un valor dentro de un combo Select.
     def verify_item_in_dropdown(self, locator, text):
-        select = Select(self.find(locator))
+        select = support_select.Select(self.find(locator))
         for item in select.options:
             if text == item.text:
                 return True
         return False
 
+    # Devuelve las opciones de un combo como datos planos [{text, value, selected, index}]
+    # en un solo execute_script, sin un WebElement por opción. Con cache=True se reutiliza
+    # el resultado hasta la próxima navegación / refresh / cambio de frame o ventana.
+    def get_dropdown_options(self, locator, cache: bool = False) -> list:
+        key = tuple(locator)
+        if cache and key in self._dropdown_cache:
+            return self._dropdown_cache[key]
+        element = self.find(locator)
+        if element is None:
+            return []
+        options = self.driver.execute_script(self.DROPDOWN_OPTIONS_SCRIPT, element)
+        if cache:
+            self._dropdown_cache[key] = options
+        return options
+
+    # Devuelve los textos de las opciones de un combo.
+    def get_dropdown_texts(self, locator, cache: bool = False) -> list:
+        return [option['text'] for option in self.get_dropdown_options(locator, cache)]
+
+    # Devuelve las opciones seleccionadas de un combo como datos planos.
+    def get_dropdown_selected_options(self, locator) -> list:
+        return [option for option in self.get_dropdown_options(locator) if option['selected']]
+
+    # Igual que verify_item_in_dropdown pero en un solo round-trip.
+    def verify_item_in_dropdown_fast(self, locator, text, cache: bool = False) -> bool:
+        return any(option['text'] == text for option in self.get_dropdown_options(locator, cache))
+
+    # Completa un formulario {locator: valor} resolviendo y cargando todos los campos en
+    # un solo execute_script. Checkbox/radio reciben bool y los select un value o texto.
+    # Los campos de keystroke_fields, los file inputs y los locators con contexto (ver
+    # in_context) se cargan con send_keys. Devuelve {locator: error} de los que fallaron
+    # (un checkbox/radio con un valor que no es bool falla con 'not_bool'); no imprime.
+    def fill_form(self, values: dict, keystroke_fields: tuple = ()) -> dict:
+        keystroke_fields = {tuple(locator) for locator in keystroke_fields}
+        scripted, keyed = [], []
+        for locator, value in values.items():
+            if len(locator) == 3 or tuple(locator) in keystroke_fields:
+                keyed.append((locator, value))
+            else:
+                scripted.append((locator, value))
+
+        failures = {}
+        if scripted:
+            fields = [[locator[0], locator[1], value if isinstance(value, bool) else str(value)]
+                      for locator, value in scripted]
+            try:
+                statuses = self.driver.execute_script(self.FILL_FORM_SCRIPT, fields)
+            except WebDriverException as e:
+                statuses = [f'error: {e.msg}'] * len(scripted)
+            for (locator, value), status in zip(scripted, statuses):
+                if status == 'needs_keys':
+                    keyed.append((locator, value))
+                elif status != 'ok':
+                    failures[locator] = status
+
+        for locator, value in keyed:
+            try:
+                target = self.__enter_context(locator)
+                element = self.wait_until(ec.presence_of_element_located(target), locator=target)
+            except TimeoutException:
+                failures[locator] = 'not_found'
+                continue
+            except WebDriverException as e:
+                failures[locator] = f'error: {e.msg}'
+                continue
+            try:
+                field_type = element.get_attribute('type')
+                if field_type in ('checkbox', 'radio'):
+                    if not isinstance(value, bool):
+                        failures[locator] = 'not_bool'
+                    elif element.is_selected() != value:
+                        element.click()
+                    continue
+                if field_type != 'file':
+                    element.clear()
+                element.send_keys(str(value))
+            except WebDriverException as e:
+                failures[locator] = f'error: {e.msg}'
+        return failures
+
     # Tílda o marca una casilla del tipo checkbox.
     def select_checkbox(self, checkbox):
         self.find(checkbox).click()
@@ -406,33 +1292,68 @@ class BasePage(By):
     def delete_all_cookies(self):
         self.driver.delete_all_cookies()
 
-    # se utiliza para eliminar todas las cookies del navegador
+    # devuelve todas las cookies del navegador
     def get_cookies(self):
-        self.driver.get_cookies()
+        return self.driver.get_cookies()
+
+    # Guarda el estado de la sesión actual (url, cookies, localStorage y sessionStorage)
+    # y lo devuelve como dict. Si se indica path también se guarda como JSON.
+    def save_session_state(self, path: Optional[str] = None) -> dict:
+        state = self.driver.execute_script(self.STORAGE_READ_SCRIPT)
+        state['cookies'] = self.driver.get_cookies()
+        state['saved_at'] = time.time()
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(state, file)
+        return state
+
+    # Restaura un estado guardado con save_session_state (dict o ruta al JSON): abre el
+    # origen, carga cookies y storage, y luego navega a la url guardada (o a url).
+    def restore_session_state(self, state, url: Optional[str] = None) -> bool:
+        if isinstance(state, str):
+            with open(state, encoding='utf-8') as file:
+                state = json.load(file)
+        try:
+            # Las cookies y el storage solo se pueden cargar estando en el mismo origen.
+            self.driver.get(state['origin'] + '/')
+            for cookie in state.get('cookies', []):
+                cookie = dict(cookie)
+                if 'expiry' in cookie:
+                    cookie['expiry'] = int(cookie['expiry'])
+                self.driver.add_cookie(cookie)
+            self.driver.execute_script(self.STORAGE_WRITE_SCRIPT,
+                                       state.get('local_storage', {}), state.get('session_storage', {}))
+        except WebDriverException as e:
+            print(f"Error al restaurar la sesión. más detalle: {e}")
+            return False
+        self.navigate_to(url or state['url'])
+        return True
 
     # Se utiliza para arrastrar y soltar un elemento web dentro de otro.
     def drag_and_drop(self, loc_source, loc_target):
         source_element = self.find(loc_source)
         target_element = self.find(loc_target)
-        action_chains = ActionChains(self.driver)
-        action_chains.drag_and_drop(source_element, target_element).perform()
+        self.__perform(self.__action_chain().drag_and_drop(source_element, target_element))
 
     # Esto simulará el comportamiento del cursor del mouse cuando se desplaza sobre
     # el elemento en la página web.
     def hover_over_element(self, element):
         element_to_hover_over = self.find(element)
-        action_chains = ActionChains(self.driver)
-        action_chains.move_to_element(element_to_hover_over).perform()
+        self.__perform(self.__action_chain().move_to_element(element_to_hover_over))
 
     # esperar hasta que un elemento de la página web desaparezca de la vista, es decir, cuando
     # el elemento ya no sea visible en la página
     def wait_for_element_to_disappear(self, element):
-        self.wait.until_not(ec.visibility_of_element_located(element))
+        self.__wait_until_not(ec.visibility_of_element_located(self.__enter_context(element)))
 
     # se utiliza para esperar a que un elemento web sea clickable, es decir, que esté en
     # un estado en el que se le puede hacer clic.
     def wait_for_element_to_be_clickable(self, element):
-        self.wait.until(ec.element_to_be_clickable(element))
+        locator = self.__enter_context(element)
+        self.wait_until(ec.element_to_be_clickable(locator), locator=locator)
 
     # se utiliza para obtener el valor de un atributo específico de un elemento web
     def get_attribute(self, element, attribute_name):
@@ -448,13 +1369,14 @@ class BasePage(By):
     # La función es útil para esperar situaciones en las que un elemento en la página cambia de
     # visibilidad,esperar hasta que un elemento web específico se vuelva invisible.
     def invisibility_of_element_located(self, locator):
-        return self.wait.until(ec.invisibility_of_element_located(locator))
+        return self.wait_until(ec.invisibility_of_element_located(self.__enter_context(locator)))
 
     # espera hasta que un elemento web especificado sea visible. Esto es útil cuando deseas
     # asegurarte de que un elemento se ha cargado y es 
     # visible en la página antes de realizar cualquier acción en él.
     def visibility_of_element_located(self, locator):
-        return self.wait.until(ec.visibility_of_element_located(locator))
+        locator = self.__enter_context(locator)
+        return self.wait_until(ec.visibility_of_element_located(locator), locator=locator)
     
     #ejecuta script javascript (ej: "return window.localStorage.getItem('token')"")
     def execute_script(self, script:str):
@@ -479,14 +1401,31 @@ class BasePage(By):
     def get_color_of_element(self, locator) -> str:
         element: WebElement = self.find(locator)
         color: str = element.value_of_css_property('background-color')
-        
-        if color in ('rgba(0, 0, 0, 0)', 'rgb(0, 0, 0)', 'transparent'):
-            return 'none'
-        
-        if color.startswith('#'):
-            return color
-        
-        return self.__rgb_to_hex(color)
+        return self.__css_color_to_hex(color)
+
+    # Devuelve el estado de varios elementos en un solo round-trip, como
+    # {locator: {'present': bool, campo: valor, ...}}. No espera a que los elementos
+    # aparezcan. Campos: displayed, enabled, checked, rect, size, text, value,
+    # color (hexadecimal como get_color_of_element) y 'css:<propiedad>'.
+    # Los locators de in_context se agrupan por ventana/frame: un script por contexto
+    # (los locators simples se leen primero, en el contexto actual).
+    def snapshot_elements(self, locators: list, fields: Optional[list] = None) -> dict:
+        fields = list(fields or self.SNAPSHOT_FIELDS)
+        groups = {}
+        for locator in locators:
+            context = locator[2] if len(locator) == 3 else None
+            groups.setdefault(context, []).append(tuple(locator))
+        snapshot = {}
+        for context, group in sorted(groups.items(), key=lambda item: item[0] is not None):
+            if context is not None:
+                self.switch_to_context(context[1], context[0])
+            states = self.driver.execute_script(self.SNAPSHOT_SCRIPT,
+                                                [[locator[0], locator[1]] for locator in group], fields)
+            for locator, state in zip(group, states):
+                if 'color' in state:
+                    state['color'] = self.__css_color_to_hex(state['color'])
+                snapshot[locator] = state
+        return {tuple(locator): snapshot[tuple(locator)] for locator in locators}
 
     # Devuelve altura, ancho, coordenadas X e X del elemento
     def get_size_coordinates(self, locator)->dict:
@@ -500,6 +1439,110 @@ class BasePage(By):
         elemente:WebElement = self.find(locator)
         return elemente.size
     
+    # Método privado: selecciona una opción x texto o value vía JS.
+    def __select_option_js(self, locator, field, wanted) -> bool:
+        element = self.find(locator)
+        if element is None:
+            return False
+        self._dropdown_cache.pop(tuple(locator), None)
+        return bool(self.driver.execute_script(self.DROPDOWN_SELECT_SCRIPT, element, field, str(wanted)))
+
+    # Método privado: aplica el bloqueo de recursos en el driver actual.
+    def __apply_resource_blocking(self) -> bool:
+        patterns = [pattern for resource in self.blocked_resources for pattern in self.RESOURCE_PATTERNS[resource]]
+        patterns += list(self.blocked_url_patterns)
+        if not hasattr(self._driver, 'execute_cdp_cmd'):
+            if self.blocked_url_patterns:
+                print("El bloqueo por patrón de URL solo está disponible en Chrome/Edge; en Firefox usar un proxy.")
+            return False
+        try:
+            self._driver.execute_cdp_cmd('Network.enable', {})
+            self._driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+            return True
+        except WebDriverException as e:
+            print(f"Error al bloquear recursos. más detalle: {e}")
+            return False
+
+    # Método privado: cadena de acciones a usar; la del batch activo o una nueva,
+    # para no arrastrar acciones encoladas de llamadas anteriores.
+    def __action_chain(self):
+        if self._batch is not None:
+            return self._batch
+        return action_chains.ActionChains(self.driver)
+
+    # Método privado: ejecuta la cadena salvo que sea la del batch activo.
+    def __perform(self, chain):
+        if chain is self._batch:
+            return
+        chain.perform()
+        self.actions_performed += 1
+
+    # Método privado: si el locator tiene contexto (ver in_context) cambia a ese
+    # contexto y devuelve el locator (By, valor).
+    def __enter_context(self, locator) -> tuple:
+        if len(locator) == 3:
+            window, frames = locator[2]
+            self.switch_to_context(frames, window)
+            return locator[0], locator[1]
+        return locator
+
+    # Método privado: navegar o refrescar vuelve al documento principal.
+    def __reset_frame_context(self):
+        self._frame_path = []
+        self._frame_elements.clear()
+
+    # Método privado: equivalente a WebDriverWait.until_not con la política de polling
+    # del page: la condición negada, y un elemento inexistente o stale cuenta como cumplida.
+    def __wait_until_not(self, condition):
+        def negated(driver):
+            try:
+                return not condition(driver)
+            except (NoSuchElementException, StaleElementReferenceException):
+                return True
+        return self.wait_until(negated)
+
+    # Método privado: espera a que la app quede quieta y avisa si no lo logró (por ej.
+    # timers recurrentes de 1 seg. o menos mantienen la página siempre "ocupada").
+    def __wait_idle(self) -> bool:
+        idle = self.wait_until_idle()
+        if not idle:
+            print(f"La página no quedó quieta en {self.wait_timeout} seg. (timers o requests recurrentes); se continúa igual.")
+        return idle
+
+    # Método privado: wait_idle explícito o el valor por defecto del page.
+    def __should_wait_idle(self, wait_idle: Optional[bool]) -> bool:
+        return self.wait_for_idle if wait_idle is None else wait_idle
+
+    # Método privado: clave del cache según locator, ventana y frame actuales.
+    def __cache_key(self, locator) -> tuple:
+        return tuple(locator), self._window, tuple(self._frame_path)
+
+    # Método privado: devuelve el elemento cacheado si sigue vigente y visible,
+    # si quedó stale (o ya no es visible) lo elimina del cache.
+    def __get_cached_element(self, locator) -> Optional[WebElement]:
+        key = self.__cache_key(locator)
+        element = self._element_cache.get(key)
+        if element is not None:
+            try:
+                if element.is_displayed():
+                    self.cache_hits += 1
+                    return element
+            except StaleElementReferenceException:
+                pass
+            del self._element_cache[key]
+        self.cache_misses += 1
+        return None
+
+    # Método privado: convierte un color CSS a hexadecimal ('none' si no está configurado).
+    def __css_color_to_hex(self, color: str) -> str:
+        if color in ('rgba(0, 0, 0, 0)', 'rgb(0, 0, 0)', 'transparent'):
+            return 'none'
+        
+        if color.startswith('#'):
+            return color
+        
+        return self.__rgb_to_hex(color)
+
     # Método privado
     def __rgb_to_hex(self, rgb: str) -> str:
     #Convierte un valor RGB en formato 'rgb(r, g, b)' o 'rgba(r, g, b, a)' a hexadecimal.
@@ -507,7 +1550,7 @@ class BasePage(By):
         rgb = rgb.replace('rgba(', '').replace('rgb(', '').replace(')', '')
         
         # Divide los valores
-        values = list(map(int, rgb.split(', ')))
+        values = list(map(int, rgb.split(', ')[:3]))
         
         # Si tiene 4 valores, es RGBA; si tiene 3, es RGB
         r, g, b = values[:3]  # Ignorar el canal alfa si es RGBA
@@ -0,0 +1,215 @@
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from BasePage import BasePage
+from SessionHealth import kill_processes, process_tree, service_pid
+
+
+# Pool de sesiones WebDriver reutilizables. Evita levantar un browser nuevo por
+# cada BasePage: las sesiones se agrupan por (browser, headless, proxy, certs),
+# se limpian entre préstamos y se limita la cantidad de browsers vivos.
+#
+# En Chrome/Edge la limpieza borra por CDP las cookies de todos los dominios, el
+# storage de cada origen visitado en las pestañas y el estado que dejan los page
+# (bloqueo de recursos y scripts de BasePage.reset_browser_state). Firefox no expone esa limpieza
+# (solo la del documento actual), así que sus sesiones se descartan al devolverlas
+# salvo allow_partial_reset=True.
+#
+#   pool = DriverPool(max_size=4)
+#   with pool.lease('chrome', headless=True) as driver:
+#       page = BasePage(driver)
+#       page.navigate_to('http://sandbox-auto/')
+#   pool.close_all()
+class DriverPool:
+
+    def __init__(self, max_size: int = 4, lease_timeout: float = 300, reset_url: str = 'about:blank',
+                 allow_partial_reset: bool = False):
+        self.max_size = max_size
+        self.lease_timeout = lease_timeout
+        self.reset_url = reset_url
+        # Reutilizar sesiones sin CDP aunque cookies/storage de otros orígenes puedan quedar.
+        self.allow_partial_reset = allow_partial_reset
+        self._idle = {}      # key -> [WebDriver]
+        self._keys = {}      # id(driver) -> key
+        self._leased = set()
+        self._live = 0
+        self._condition = threading.Condition()
+        # Estadísticas
+        self.leases = 0
+        self.reuses = 0
+        self.created = 0
+        self.discarded = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    # Presta una sesión (context manager) y la devuelve al pool al salir.
+    @contextmanager
+    def lease(self, driver_to_use: str = 'chrome', headless: bool = False, proxy: str = '',
+              ignore_cert_errors: bool = True):
+        driver = self.acquire(driver_to_use, headless, proxy, ignore_cert_errors)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    # Obtiene una sesión del pool: reutiliza una libre con la misma configuración,
+    # crea una nueva si hay lugar, o espera a que otra se libere.
+    def acquire(self, driver_to_use: str = 'chrome', headless: bool = False, proxy: str = '',
+                ignore_cert_errors: bool = True) -> WebDriver:
+        key = (driver_to_use.lower(), headless, proxy, ignore_cert_errors)
+        start = time.perf_counter()
+        victim = None
+        with self._condition:
+            while True:
+                idle = self._idle.get(key)
+                if idle:
+                    driver = idle.pop()
+                    self.reuses += 1
+                    break
+                if self._live < self.max_size:
+                    driver = None
+                    self._live += 1
+                    break
+                # Pool lleno: si hay una sesión libre de otra configuración se descarta.
+                other = next((k for k, drivers in self._idle.items() if drivers), None)
+                if other is not None:
+                    victim = self._idle[other].pop()
+                    self._keys.pop(id(victim), None)
+                    self.discarded += 1
+                    driver = None
+                    break
+                remaining = self.lease_timeout - (time.perf_counter() - start)
+                if remaining <= 0:
+                    raise TimeoutError(f"No hay sesiones libres en el pool luego de {self.lease_timeout} seg.")
+                self._condition.wait(remaining)
+            self.leases += 1
+        if victim is not None:
+            self.__quit(victim)
+        if driver is None:
+            try:
+                driver = BasePage.create_driver(*key)
+            except Exception:
+                with self._condition:
+                    self._live -= 1
+                    self._condition.notify()
+                raise
+            with self._condition:
+                self.created += 1
+                self._keys[id(driver)] = key
+        waited = time.perf_counter() - start
+        with self._condition:
+            self._leased.add(driver)
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+        return driver
+
+    # Devuelve la sesión al pool dejándola limpia (cookies, storage, ventanas extra).
+    # Si la sesión ya no responde (por ej. navigate_to hizo quit) se descarta.
+    # Solo se aceptan sesiones prestadas por este pool y no devueltas todavía.
+    def release(self, driver: WebDriver):
+        with self._condition:
+            if driver not in self._leased:
+                raise ValueError("La sesión no fue prestada por este pool o ya fue devuelta.")
+            self._leased.discard(driver)
+        healthy = self.__reset(driver)
+        with self._condition:
+            key = self._keys.get(id(driver))
+            if healthy and key is not None:
+                self._idle.setdefault(key, []).append(driver)
+            else:
+                self._keys.pop(id(driver), None)
+                self._live -= 1
+                self.discarded += 1
+            self._condition.notify()
+        if not healthy:
+            self.__quit(driver)
+
+    # Cierra todas las sesiones libres del pool.
+    def close_all(self):
+        with self._condition:
+            drivers = [driver for idle in self._idle.values() for driver in idle]
+            self._idle.clear()
+            for driver in drivers:
+                self._keys.pop(id(driver), None)
+            self._live -= len(drivers)
+            self._condition.notify_all()
+        for driver in drivers:
+            self.__quit(driver)
+
+    # Devuelve las métricas del pool.
+    def get_stats(self) -> dict:
+        with self._condition:
+            return {
+                'live': self._live,
+                'idle': sum(len(idle) for idle in self._idle.values()),
+                'leases': self.leases,
+                'reuses': self.reuses,
+                'created': self.created,
+                'discarded': self.discarded,
+                'total_wait': self.total_wait,
+                'avg_wait': self.total_wait / self.leases if self.leases else 0.0,
+                'max_wait': self.max_wait,
+            }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close_all()
+
+    # Método privado: limpia el estado de la sesión. Devuelve False si no responde o
+    # si no se puede limpiar por completo (sin CDP y sin allow_partial_reset).
+    def __reset(self, driver: WebDriver) -> bool:
+        cdp = hasattr(driver, 'execute_cdp_cmd')
+        if not cdp and not self.allow_partial_reset:
+            return False
+        try:
+            origins = set()
+            handles = driver.window_handles
+            for handle in reversed(handles):
+                driver.switch_to.window(handle)
+                if cdp:
+                    origins.update(self.__visited_origins(driver))
+                if handle != handles[0]:
+                    driver.close()
+            driver.switch_to.window(handles[0])
+            driver.delete_all_cookies()
+            driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+            if cdp:
+                # Bloqueo de recursos y scripts de los page que usaron la sesión.
+                BasePage.reset_browser_state(driver)
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+                for origin in origins:
+                    driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+            driver.get(self.reset_url)
+            return True
+        except WebDriverException as e:
+            print(f"Se descarta la sesión del pool. más detalle: {e}")
+            return False
+
+    # Método privado: orígenes http(s) del historial de la pestaña actual (CDP).
+    @staticmethod
+    def __visited_origins(driver: WebDriver) -> set:
+        origins = set()
+        history = driver.execute_cdp_cmd('Page.getNavigationHistory', {})
+        for entry in history.get('entries', []):
+            url = urlsplit(entry.get('url', ''))
+            if url.scheme in ('http', 'https'):
+                origins.add(f'{url.scheme}://{url.netloc}')
+        return origins
+
+    # Método privado: cierra el browser sin propagar errores y mata los procesos
+    # que hayan quedado vivos (browser colgado).
+    @staticmethod
+    def __quit(driver: WebDriver):
+        pid = service_pid(driver)
+        processes = process_tree(pid) if pid is not None else []
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Error al cerrar el browser. más detalle: {e}")
+        if processes:
+            kill_processes(processes)
@@ -0,0 +1,216 @@
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.wait import WebDriverWait
+import Polling
+
+
+# Instrumentación de BasePage: cuenta llamadas y tiempos por método, separa el
+# tiempo esperando en WebDriverWait o en las políticas de Polling (y sus iteraciones
+# de polling) del tiempo en
+# comandos remotos, y suma los bytes recibidos del driver (ej. capturas).
+#
+#   metrics = Instrumentation()
+#   page = metrics.instrument(page)
+#   ...
+#   metrics.export_json('metrics.json')
+#   metrics.export_chrome_trace('trace.json')  # abrir en chrome://tracing o Perfetto
+class Instrumentation:
+
+    _drivers = {}  # id(driver) -> Instrumentation, para el parche de WebDriverWait
+    _original_until = None
+    _original_until_not = None
+
+    def __init__(self, max_events: int = 100000):
+        self.max_events = max_events
+        self.methods = {}
+        self.commands = {}
+        self.waits = {'calls': 0, 'polls': 0, 'total': 0.0, 'timeouts': 0}
+        self.events = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter()
+        self._instrumented = []
+
+    # Envuelve los métodos públicos del page, el command executor de su driver y
+    # los WebDriverWait que usen ese driver. Devuelve el mismo page.
+    def instrument(self, page):
+        for name, function in inspect.getmembers(type(page), inspect.isfunction):
+            if not name.startswith('_'):
+                setattr(page, name, self.__wrap_method(name, getattr(page, name)))
+
+        executor = page.driver.command_executor
+        original_execute = executor.execute
+        executor.execute = self.__wrap_execute(original_execute)
+        self._instrumented.append((page, executor, original_execute))
+
+        Instrumentation.__patch_waits()
+        Instrumentation._drivers[id(page.driver)] = self
+        return page
+
+    # Quita la instrumentación de todos los page instrumentados.
+    def uninstrument(self):
+        for page, executor, original_execute in self._instrumented:
+            for name, function in inspect.getmembers(type(page), inspect.isfunction):
+                if not name.startswith('_'):
+                    page.__dict__.pop(name, None)
+            executor.execute = original_execute
+            Instrumentation._drivers.pop(id(page.driver), None)
+        self._instrumented = []
+
+    # Devuelve las métricas acumuladas. Los métodos se ordenan por tiempo total.
+    def to_dict(self) -> dict:
+        with self._lock:
+            methods = sorted(self.methods.items(), key=lambda item: item[1]['total'], reverse=True)
+            return {
+                'methods': {name: dict(stats) for name, stats in methods},
+                'commands': {name: dict(stats) for name, stats in self.commands.items()},
+                'waits': dict(self.waits),
+            }
+
+    def export_json(self, path: str):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    # Exporta los eventos en formato Chrome trace (Trace Event Format).
+    def export_chrome_trace(self, path: str):
+        with self._lock:
+            events = list(self.events)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file)
+
+    # Método privado: registra un evento completo ("ph": "X") para el trace.
+    def __add_event(self, name: str, category: str, start: float, duration: float, args: dict = None):
+        if len(self.events) >= self.max_events:
+            return
+        event = {'name': name, 'cat': category, 'ph': 'X',
+                 'ts': (start - self._origin) * 1e6, 'dur': duration * 1e6,
+                 'pid': os.getpid(), 'tid': threading.get_ident()}
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    # Método privado: stack de métodos del thread actual, para atribuir comandos y esperas.
+    def __stack(self) -> list:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def __method_stats(self, name: str) -> dict:
+        stats = self.methods.get(name)
+        if stats is None:
+            stats = self.methods[name] = {'calls': 0, 'total': 0.0, 'max': 0.0, 'errors': 0,
+                                          'commands': 0, 'command_time': 0.0,
+                                          'wait_time': 0.0, 'polls': 0, 'bytes': 0}
+        return stats
+
+    def __wrap_method(self, name: str, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            stack = self.__stack()
+            stack.append(name)
+            start = time.perf_counter()
+            failed = False
+            try:
+                return method(*args, **kwargs)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                duration = time.perf_counter() - start
+                stack.pop()
+                with self._lock:
+                    stats = self.__method_stats(name)
+                    stats['calls'] += 1
+                    stats['total'] += duration
+                    stats['max'] = max(stats['max'], duration)
+                    stats['errors'] += failed
+                    self.__add_event(name, 'method', start, duration)
+        return wrapper
+
+    def __wrap_execute(self, execute):
+        @functools.wraps(execute)
+        def wrapper(command, params=None):
+            start = time.perf_counter()
+            response = execute(command, params)
+            duration = time.perf_counter() - start
+            value = response.get('value') if isinstance(response, dict) else None
+            # Se cuentan los bytes de respuestas de texto (capturas en base64, page source, etc.).
+            size = len(value) if isinstance(value, (str, bytes)) else 0
+            stack = self.__stack()
+            with self._lock:
+                stats = self.commands.setdefault(command, {'calls': 0, 'total': 0.0, 'bytes': 0})
+                stats['calls'] += 1
+                stats['total'] += duration
+                stats['bytes'] += size
+                if stack:
+                    method = self.__method_stats(stack[-1])
+                    method['commands'] += 1
+                    method['command_time'] += duration
+                    method['bytes'] += size
+                self.__add_event(command, 'command', start, duration, {'bytes': size} if size else None)
+            return response
+        return wrapper
+
+    # Método privado: registra una espera de WebDriverWait o de una política de Polling.
+    def __record_wait(self, name: str, start: float, duration: float, polls: int, timed_out: bool):
+        stack = self.__stack()
+        with self._lock:
+            self.waits['calls'] += 1
+            self.waits['polls'] += polls
+            self.waits['total'] += duration
+            self.waits['timeouts'] += timed_out
+            if stack:
+                method = self.__method_stats(stack[-1])
+                method['wait_time'] += duration
+                method['polls'] += polls
+            self.__add_event(name, 'wait', start, duration, {'polls': polls, 'timeout': timed_out})
+
+    # Método privado: parchea WebDriverWait.until / until_not y registra el hook de
+    # Polling una sola vez. Solo mide las esperas cuyo driver esté instrumentado.
+    @classmethod
+    def __patch_waits(cls):
+        if cls._original_until is not None:
+            return
+        cls._original_until = WebDriverWait.until
+        cls._original_until_not = WebDriverWait.until_not
+        WebDriverWait.until = cls.__measured_wait(cls._original_until, 'until')
+        WebDriverWait.until_not = cls.__measured_wait(cls._original_until_not, 'until_not')
+        Polling.WAIT_HOOKS.append(cls.__policy_wait)
+
+    @staticmethod
+    def __policy_wait(name, driver, start, duration, polls, timed_out):
+        instrumentation = Instrumentation._drivers.get(id(driver))
+        if instrumentation is not None:
+            instrumentation.__record_wait(name, start, duration, polls, timed_out)
+
+    @staticmethod
+    def __measured_wait(original, name):
+        @functools.wraps(original)
+        def wrapper(wait, method, message=''):
+            instrumentation = Instrumentation._drivers.get(id(wait._driver))
+            if instrumentation is None:
+                return original(wait, method, message)
+            polls = 0
+
+            def counted(driver):
+                nonlocal polls
+                polls += 1
+                return method(driver)
+
+            start = time.perf_counter()
+            timed_out = False
+            try:
+                return original(wait, counted, message)
+            except TimeoutException:
+                timed_out = True
+                raise
+            finally:
+                instrumentation.__record_wait(f'WebDriverWait.{name}', start, time.perf_counter() - start,
+                                             polls, timed_out)
+        return wrapper
@@ -0,0 +1,142 @@
+import multiprocessing
+import os.path
+import pickle
+import queue
+import signal
+import sys
+import time
+import traceback
+from BasePage import BasePage
+
+
+# Ejecuta escenarios de page objects en paralelo sobre N procesos. Cada proceso
+# crea su propio BasePage (por defecto headless), guarda sus capturas en
+# screenshots/worker_<n> y devuelve los resultados al proceso principal.
+#
+# Un escenario es una función de nivel módulo (para que se pueda serializar)
+# que recibe el page del worker:
+#
+#   def abrir_home(page):
+#       page.navigate_to('http://sandbox-auto/')
+#       return page.get_title()
+#
+#   report = run_parallel([abrir_home] * 20, workers=4)
+def run_parallel(scenarios: list,
+                 workers: int = None,
+                 page_class: type = BasePage,
+                 page_kwargs: dict = None,
+                 screenshots_dir: str = 'screenshots',
+                 start_method: str = None) -> dict:
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(scenarios)))
+    page_kwargs = dict(page_kwargs or {})
+    page_kwargs.setdefault('headless', True)
+    context = multiprocessing.get_context(start_method)
+    tasks = context.Queue()
+    results = context.Queue()
+
+    for index, scenario in enumerate(scenarios):
+        tasks.put((index, scenario))
+    for _ in range(workers):
+        tasks.put(None)
+
+    start = time.perf_counter()
+    # Los workers no son daemon: si el proceso principal se interrumpe se les pide
+    # terminar (SIGTERM) y cierran su browser en el finally en vez de morir de golpe.
+    processes = [context.Process(target=_worker,
+                                 args=(n, page_class, page_kwargs, screenshots_dir, tasks, results))
+                 for n in range(workers)]
+    collected = {}
+    try:
+        for process in processes:
+            process.start()
+        while len(collected) < len(scenarios):
+            try:
+                result = results.get(timeout=1)
+                collected[result['index']] = result
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    break
+        for process in processes:
+            process.join()
+    finally:
+        _stop_workers(processes)
+
+    ordered = []
+    for index, scenario in enumerate(scenarios):
+        ordered.append(collected.get(index, {
+            'index': index,
+            'name': _scenario_name(scenario),
+            'worker': None,
+            'ok': False,
+            'duration': 0.0,
+            'result': None,
+            'error': 'El worker terminó sin devolver resultado.',
+        }))
+    passed = sum(1 for result in ordered if result['ok'])
+    return {
+        'workers': workers,
+        'duration': time.perf_counter() - start,
+        'passed': passed,
+        'failed': len(ordered) - passed,
+        'results': ordered,
+    }
+
+
+# Termina los workers que sigan vivos: primero SIGTERM (cierran su browser) y, si no
+# terminan a tiempo, kill.
+def _stop_workers(processes: list, timeout: float = 30):
+    alive = [process for process in processes if process.pid is not None and process.is_alive()]
+    for process in alive:
+        process.terminate()
+    end = time.monotonic() + timeout
+    for process in alive:
+        process.join(max(0.0, end - time.monotonic()))
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+
+# Proceso worker: crea su page, ejecuta escenarios hasta recibir None y cierra el browser.
+# SIGTERM se convierte en SystemExit para que el finally cierre el browser.
+def _worker(number, page_class, page_kwargs, screenshots_dir, tasks, results):
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
+    page = None
+    startup_error = None
+    try:
+        page = page_class(**page_kwargs)
+        page.screenshot_dir = os.path.join(screenshots_dir, f'worker_{number}')
+    except Exception:
+        startup_error = traceback.format_exc()
+
+    try:
+        while True:
+            item = tasks.get()
+            if item is None:
+                break
+            index, scenario = item
+            result = {'index': index, 'name': _scenario_name(scenario), 'worker': number,
+                      'ok': False, 'duration': 0.0, 'result': None, 'error': startup_error}
+            if page is not None:
+                start = time.perf_counter()
+                try:
+                    value = scenario(page)
+                    try:
+                        pickle.dumps(value)
+                    except Exception:
+                        value = repr(value)
+                    result.update(ok=True, result=value)
+                except Exception:
+                    result['error'] = traceback.format_exc()
+                result['duration'] = time.perf_counter() - start
+            results.put(result)
+    finally:
+        if page is not None:
+            try:
+                page.close_browser()
+            except Exception as e:
+                print(f"Error al cerrar el browser del worker {number}. más detalle: {e}")
+
+
+def _scenario_name(scenario) -> str:
+    return getattr(scenario, '__name__', None) or getattr(getattr(scenario, 'func', None), '__name__', repr(scenario))
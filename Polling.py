@@ -0,0 +1,142 @@
+import time
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import WebDriverException
+
+
+# Políticas de polling para las esperas de BasePage. WebDriverWait consulta cada
+# 0.5 seg.; estas políticas reducen la latencia cuando el elemento aparece rápido.
+# Todas exponen until(page, condition, timeout, locator) y devuelven lo mismo que
+# la condición (o lanzan TimeoutException).
+
+
+# Polling fijo, igual que WebDriverWait.
+class FixedPolling:
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+
+    def until(self, page, condition, timeout: float, locator=None):
+        return _poll(page.driver, condition, timeout, lambda attempt: self.interval)
+
+
+# Backoff exponencial: empieza con unos pocos ms y crece hasta max_interval.
+class BackoffPolling:
+
+    def __init__(self, initial: float = 0.005, factor: float = 2.0, max_interval: float = 0.5):
+        self.initial = initial
+        self.factor = factor
+        self.max_interval = max_interval
+
+    def until(self, page, condition, timeout: float, locator=None):
+        return _poll(page.driver, condition, timeout,
+                     lambda attempt: min(self.initial * self.factor ** attempt, self.max_interval))
+
+
+# Espera del lado del browser con un MutationObserver: el script se resuelve apenas
+# el locator existe y es visible. Luego se valida con la condición de WebDriver; si
+# no hay locator o el browser no soporta la espera, sigue con backoff.
+class ObserverPolling:
+
+    OBSERVER_SCRIPT = """
+        var by = arguments[0], value = arguments[1], timeout = arguments[2];
+        var done = arguments[arguments.length - 1], observer = null, timer = null;
+        function visible() {
+            var el = findBy(by, value);
+            if (!el || !el.getClientRects().length) { return false; }
+            var style = window.getComputedStyle(el);
+            return style.visibility !== 'hidden' && style.display !== 'none';
+        }
+        function finish(result) {
+            if (observer) { observer.disconnect(); }
+            if (timer) { clearTimeout(timer); }
+            done(result);
+        }
+        if (visible()) { return finish(true); }
+        observer = new MutationObserver(function () { if (visible()) { finish(true); } });
+        observer.observe(document, {childList: true, subtree: true, attributes: true});
+        timer = setTimeout(function () { finish(false); }, timeout);
+    """
+
+    def __init__(self, fallback: BackoffPolling = None):
+        self.fallback = fallback or BackoffPolling()
+
+    def until(self, page, condition, timeout: float, locator=None):
+        start = time.monotonic()
+        if locator is not None:
+            try:
+                # El script se corta antes que el script timeout del driver (30 seg. por defecto).
+                budget = min(timeout, 25)
+                page.driver.execute_async_script(page.FIND_BY_SCRIPT + self.OBSERVER_SCRIPT,
+                                                 locator[0], locator[1], int(budget * 1000))
+            except WebDriverException:
+                pass
+        remaining = max(0.0, timeout - (time.monotonic() - start))
+        return self.fallback.until(page, condition, remaining, locator)
+
+
+POLICIES = {
+    'fixed': FixedPolling,
+    'backoff': BackoffPolling,
+    'observer': ObserverPolling,
+}
+
+
+# Funciones hook(name, driver, start, duration, polls, timed_out) que se llaman al
+# terminar cada espera hecha con wait (por ej. Instrumentation registra la suya).
+WAIT_HOOKS = []
+
+
+# Espera con la política indicada contando las evaluaciones de la condición y
+# avisando a WAIT_HOOKS. Sin hooks registrados llama directo a policy.until.
+def wait(policy, page, condition, timeout: float, locator=None):
+    policy = get_policy(policy)
+    if not WAIT_HOOKS:
+        return policy.until(page, condition, timeout, locator)
+    polls = 0
+
+    def counted(driver):
+        nonlocal polls
+        polls += 1
+        return condition(driver)
+
+    start = time.perf_counter()
+    timed_out = False
+    try:
+        return policy.until(page, counted, timeout, locator)
+    except TimeoutException:
+        timed_out = True
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        for hook in list(WAIT_HOOKS):
+            hook(f'{type(policy).__name__}.until', page.driver, start, duration, polls, timed_out)
+
+
+# Devuelve una instancia de política a partir de un nombre ('fixed', 'backoff',
+# 'observer') o de una instancia ya creada.
+def get_policy(policy):
+    if isinstance(policy, str):
+        if policy not in POLICIES:
+            raise ValueError(f"Invalido 'polling': {policy}. solo se admite: {', '.join(POLICIES)}.")
+        return POLICIES[policy]()
+    return policy
+
+
+# Loop de espera común: evalúa la condición ignorando NoSuchElementException (como
+# WebDriverWait) y duerme según interval(intento) sin pasarse del timeout.
+def _poll(driver, condition, timeout: float, interval):
+    end = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        try:
+            value = condition(driver)
+            if value:
+                return value
+        except NoSuchElementException:
+            pass
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutException(f"La condición no se cumplió en {timeout} seg.")
+        time.sleep(min(interval(attempt), remaining))
+        attempt += 1
@@ -0,0 +1,146 @@
+import os.path
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from io import BytesIO
+
+
+# Pipeline de capturas en segundo plano: capture() solo pide el PNG al driver y
+# vuelve enseguida; el decode, el redimensionado / recompresión con PIL y la
+# escritura a disco se hacen en un pool de threads con una cola acotada.
+#
+#   pipeline = ScreenshotPipeline(image_format='WEBP', max_width=1280)
+#   page.take_screenshot_async('login', pipeline)
+#   ...
+#   pipeline.flush()  # en el teardown
+#   print(pipeline.get_stats())
+class ScreenshotPipeline:
+
+    FORMATS = {'PNG': '.png', 'JPEG': '.jpg', 'WEBP': '.webp'}
+
+    def __init__(self,
+                 directory: str = 'screenshots',
+                 image_format: str = 'PNG',
+                 quality: int = 85,
+                 max_width: int = None,
+                 max_workers: int = 2,
+                 max_queue: int = 32):
+        image_format = image_format.upper()
+        if image_format not in self.FORMATS:
+            raise ValueError(f"Formato invalido: {image_format}. solo se admite: {', '.join(self.FORMATS)}.")
+        self.directory = directory
+        self.image_format = image_format
+        self.quality = quality
+        self.max_width = max_width
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='screenshot')
+        self._slots = threading.BoundedSemaphore(max_queue)
+        self._lock = threading.Lock()
+        self._pending = set()
+        # Estadísticas
+        self.captured = 0
+        self.written = 0
+        self.failed = 0
+        self.raw_bytes = 0
+        self.written_bytes = 0
+        self.capture_time = 0.0
+        self.offloaded_time = 0.0
+
+    # Toma la captura (page o driver) y encola su procesamiento. Devuelve un Future con
+    # la ruta del archivo. Si la cola está llena espera a que se libere un lugar.
+    def capture(self, page_or_driver, title: str) -> Future:
+        driver = getattr(page_or_driver, 'driver', page_or_driver)
+        start = time.perf_counter()
+        png = driver.get_screenshot_as_png()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.captured += 1
+            self.capture_time += elapsed
+        return self.submit(png, title)
+
+    # Encola bytes PNG ya capturados.
+    def submit(self, png: bytes, title: str) -> Future:
+        date = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        path = os.path.join(self.directory, title + '_' + date + self.FORMATS[self.image_format])
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self.__process, png, path)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self.__done)
+        return future
+
+    # Espera a que se escriban todas las capturas pendientes (usar en el teardown).
+    def flush(self, timeout: float = None):
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            try:
+                future.result(timeout)
+            except Exception as e:
+                print(f"Error al guardar la captura. más detalle: {e}")
+
+    # Espera las capturas pendientes y libera los threads.
+    def close(self):
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    # Devuelve bytes ahorrados y tiempo sacado del thread del test.
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                'captured': self.captured,
+                'written': self.written,
+                'failed': self.failed,
+                'pending': len(self._pending),
+                'raw_bytes': self.raw_bytes,
+                'written_bytes': self.written_bytes,
+                'bytes_saved': self.raw_bytes - self.written_bytes,
+                'capture_time': self.capture_time,
+                'offloaded_time': self.offloaded_time,
+            }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # Método privado: procesa y escribe una captura (corre en el pool).
+    def __process(self, png: bytes, path: str) -> str:
+        start = time.perf_counter()
+        data = png
+        if self.image_format != 'PNG' or self.max_width:
+            from PIL import Image
+            with Image.open(BytesIO(png)) as img:
+                if self.max_width and img.width > self.max_width:
+                    height = round(img.height * self.max_width / img.width)
+                    img = img.resize((self.max_width, height), Image.LANCZOS)
+                if self.image_format == 'JPEG' and img.mode != 'RGB':
+                    img = img.convert('RGB')
+                with BytesIO() as buffer:
+                    if self.image_format == 'PNG':
+                        img.save(buffer, format='PNG', optimize=True)
+                    else:
+                        img.save(buffer, format=self.image_format, quality=self.quality)
+                    data = buffer.getvalue()
+        os.makedirs(self.directory, exist_ok=True)
+        with open(path, 'wb') as file:
+            file.write(data)
+        with self._lock:
+            self.written += 1
+            self.raw_bytes += len(png)
+            self.written_bytes += len(data)
+            self.offloaded_time += time.perf_counter() - start
+        return path
+
+    # Método privado: libera el lugar en la cola al terminar cada captura.
+    def __done(self, future: Future):
+        self._slots.release()
+        with self._lock:
+            self._pending.discard(future)
+            if future.exception() is not None:
+                self.failed += 1
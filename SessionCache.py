@@ -0,0 +1,77 @@
+import hashlib
+import json
+import os.path
+import time
+
+
+# Cache de sesiones (cookies + storage) por usuario y ambiente, para no repetir el
+# login UI en cada test:
+#
+#   sessions = SessionCache(ttl=1800)
+#   sessions.restore_or_login(page, 'admin', 'qa', login_admin)
+#
+# login es una función que recibe el page y hace el login por la UI. Las entradas
+# vencen a los ttl segundos o cuando vence la primera cookie de la sesión.
+class SessionCache:
+
+    def __init__(self, directory: str = '.sessions', ttl: float = 1800):
+        self.directory = directory
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    # Devuelve el estado guardado para (user, env) o None si no existe o venció.
+    def get(self, user: str, env: str):
+        path = self.__path(user, env)
+        try:
+            with open(path, encoding='utf-8') as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if self.__expired(state):
+            self.invalidate(user, env)
+            return None
+        return state
+
+    # Guarda un estado (de BasePage.save_session_state) para (user, env).
+    def put(self, user: str, env: str, state: dict):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.__path(user, env)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(state, file)
+        os.replace(temp_path, path)
+
+    # Elimina la sesión guardada (por ej. si el restore no dejó al usuario logueado).
+    def invalidate(self, user: str, env: str):
+        try:
+            os.remove(self.__path(user, env))
+        except OSError:
+            pass
+
+    # Restaura la sesión cacheada en el page; si no hay (o falla) ejecuta login(page)
+    # y guarda la sesión resultante. Devuelve True si se reutilizó una sesión.
+    def restore_or_login(self, page, user: str, env: str, login, url: str = None) -> bool:
+        state = self.get(user, env)
+        if state is not None and page.restore_session_state(state, url):
+            self.hits += 1
+            return True
+        self.misses += 1
+        login(page)
+        self.put(user, env, page.save_session_state())
+        if url:
+            page.navigate_to(url)
+        return False
+
+    # Método privado: vence por ttl o por la primera cookie con expiry.
+    def __expired(self, state: dict) -> bool:
+        now = time.time()
+        if now - state.get('saved_at', 0) > self.ttl:
+            return True
+        expiries = [cookie['expiry'] for cookie in state.get('cookies', []) if 'expiry' in cookie]
+        return bool(expiries) and min(expiries) <= now
+
+    # Método privado: archivo de la sesión; el nombre se deriva de (user, env).
+    def __path(self, user: str, env: str) -> str:
+        digest = hashlib.sha1(f'{env}\0{user}'.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.directory, f'{digest}.json')
@@ -0,0 +1,261 @@
+import functools
+import os
+import signal
+import time
+from collections import deque
+from selenium.webdriver.remote.command import Command
+
+try:
+    import psutil
+except ImportError:  # psutil es opcional; sin él se lee /proc (solo Linux).
+    psutil = None
+
+
+# Manager de salud para sesiones largas (workers de monitoreo). Mide la memoria
+# (RSS) de los procesos del browser, la latencia de los comandos y las páginas
+# visitadas; al superar un límite recicla el driver: lo cierra garantizando que no
+# queden procesos, crea uno nuevo y vuelve a la URL actual (y opcionalmente a la
+# sesión: cookies y storage).
+#
+#   health = SessionHealthManager(page, max_rss_mb=1500, max_pages=300, restore_state=True)
+#   for url in urls:
+#       page.navigate_to(url)   # cada navegación cuenta y puede disparar el reciclado
+class SessionHealthManager:
+
+    # Comandos que no cuentan para la latencia: navegaciones (dependen del sitio) y
+    # scripts async que esperan del lado del browser (wait_until_idle, ObserverPolling).
+    UNTRACKED_COMMANDS = frozenset({
+        Command.NEW_SESSION, Command.QUIT, Command.GET, Command.REFRESH,
+        Command.GO_BACK, Command.GO_FORWARD, Command.EXECUTE_ASYNC_SCRIPT,
+    })
+
+    def __init__(self,
+                 page,
+                 max_rss_mb: float = 1500,
+                 max_pages: int = 500,
+                 max_latency: float = 5.0,
+                 latency_window: int = 50,
+                 check_every: int = 10,
+                 restore_state: bool = False,
+                 driver_factory=None):
+        self.page = page
+        self.max_rss_mb = max_rss_mb
+        self.max_pages = max_pages
+        # Latencia promedio máxima (seg.) de los últimos latency_window comandos.
+        self.max_latency = max_latency
+        self.check_every = check_every
+        self.restore_state = restore_state
+        # Si el page recibió un driver externo, driver_factory() crea el reemplazo
+        # (el page no relanza browsers que no creó).
+        if driver_factory is None and not page.owns_driver():
+            raise ValueError("El page usa un driver externo: SessionHealthManager requiere 'driver_factory'.")
+        self.driver_factory = driver_factory
+        self.pages_visited = 0
+        self.recycles = 0
+        self.last_rss_mb = None
+        self.last_recycle_reason = None
+        self._latencies = deque(maxlen=latency_window)
+        self._executor = None
+
+        navigate_to = page.navigate_to
+
+        @functools.wraps(navigate_to)
+        def tracked_navigate_to(*args, **kwargs):
+            result = navigate_to(*args, **kwargs)
+            self.pages_visited += 1
+            self.check()
+            return result
+
+        page.navigate_to = tracked_navigate_to
+        if page.has_driver():
+            self.__track_latency()
+
+    # Revisa los límites y recicla si corresponde. Devuelve el motivo o None. El RSS
+    # se mide cada check_every páginas (o si force=True) porque recorre los procesos.
+    def check(self, force: bool = False) -> str:
+        if not self.page.has_driver():
+            return None
+        self.__track_latency()
+        reason = None
+        if self.max_pages and self.pages_visited >= self.max_pages:
+            reason = f'páginas visitadas {self.pages_visited} >= {self.max_pages}'
+        latency = self.average_latency()
+        if reason is None and self.max_latency and len(self._latencies) == self._latencies.maxlen \
+                and latency >= self.max_latency:
+            reason = f'latencia promedio {latency:.2f}s >= {self.max_latency}s'
+        if reason is None and self.max_rss_mb and (force or self.pages_visited % self.check_every == 0):
+            self.last_rss_mb = self.browser_rss_mb()
+            if self.last_rss_mb is not None and self.last_rss_mb >= self.max_rss_mb:
+                reason = f'memoria {self.last_rss_mb:.0f} MB >= {self.max_rss_mb} MB'
+        if reason:
+            self.recycle(reason)
+        return reason
+
+    # Cierra el browser actual y crea uno nuevo en la misma URL (y sesión si restore_state).
+    def recycle(self, reason: str = 'manual'):
+        page = self.page
+        url, state = None, None
+        try:
+            url = page.current_url()
+            if self.restore_state:
+                state = page.save_session_state()
+        except Exception as e:
+            print(f"No se pudo leer el estado antes de reciclar el browser. más detalle: {e}")
+        page.close_browser()
+        if self.driver_factory is not None:
+            page.driver = self.driver_factory()
+        self.recycles += 1
+        self.last_recycle_reason = reason
+        self.pages_visited = 0
+        self._latencies.clear()
+        self.__track_latency()
+        if state is not None and state.get('origin', 'null') != 'null':
+            page.restore_session_state(state, url)
+        elif url and not url.startswith(('about:', 'data:')):
+            page.driver.get(url)
+
+    # Promedio (seg.) de la latencia de los últimos comandos.
+    def average_latency(self) -> float:
+        return sum(self._latencies) / len(self._latencies) if self._latencies else 0.0
+
+    # RSS total (MB) del driver y los procesos del browser, o None si no se puede medir.
+    def browser_rss_mb(self):
+        pid = service_pid(self.page.driver)
+        if pid is None:
+            return None
+        rss = process_tree_rss(pid)
+        return rss / (1024 * 1024) if rss is not None else None
+
+    def get_stats(self) -> dict:
+        return {
+            'pages_visited': self.pages_visited,
+            'recycles': self.recycles,
+            'last_recycle_reason': self.last_recycle_reason,
+            'last_rss_mb': self.last_rss_mb,
+            'average_latency': self.average_latency(),
+        }
+
+    # Método privado: mide la latencia de los comandos del driver actual (salvo UNTRACKED_COMMANDS).
+    def __track_latency(self):
+        executor = self.page.driver.command_executor
+        if executor is self._executor:
+            return
+        self._executor = executor
+        execute = executor.execute
+
+        @functools.wraps(execute)
+        def timed_execute(command, params=None):
+            if command in self.UNTRACKED_COMMANDS:
+                return execute(command, params)
+            start = time.perf_counter()
+            try:
+                return execute(command, params)
+            finally:
+                self._latencies.append(time.perf_counter() - start)
+
+        executor.execute = timed_execute
+
+
+# PID del proceso del driver (chromedriver / geckodriver / msedgedriver), o None en drivers remotos.
+def service_pid(driver):
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    return getattr(process, 'pid', None)
+
+
+# PIDs del proceso y todos sus descendientes.
+def process_tree_pids(pid: int) -> list:
+    if psutil is not None:
+        try:
+            parent = psutil.Process(pid)
+            return [pid] + [child.pid for child in parent.children(recursive=True)]
+        except psutil.Error:
+            return []
+    children = {}
+    try:
+        entries = os.listdir('/proc')
+    except OSError:
+        return [pid]
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', encoding='utf-8') as file:
+                # El campo 4 es el ppid; el nombre (campo 2) puede tener espacios.
+                ppid = int(file.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    pids, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        pids.append(current)
+        pending.extend(children.get(current, []))
+    return pids
+
+
+# Procesos del árbol de pid, para kill_processes: objetos psutil.Process o, sin
+# psutil, (pid, inicio) con el instante de inicio leído de /proc. Se toman antes del
+# quit para poder reconocerlos después aunque el pid se haya reutilizado.
+def process_tree(pid: int) -> list:
+    if psutil is not None:
+        try:
+            parent = psutil.Process(pid)
+            return [parent] + parent.children(recursive=True)
+        except psutil.Error:
+            return []
+    processes = []
+    for current in process_tree_pids(pid):
+        start_time = _proc_start_time(current)
+        if start_time is not None:
+            processes.append((current, start_time))
+    return processes
+
+
+# RSS total (bytes) del árbol de procesos, o None si no se puede medir.
+def process_tree_rss(pid: int):
+    total = 0
+    measured = False
+    for current in process_tree_pids(pid):
+        if psutil is not None:
+            try:
+                total += psutil.Process(current).memory_info().rss
+                measured = True
+            except psutil.Error:
+                pass
+            continue
+        try:
+            with open(f'/proc/{current}/status', encoding='utf-8') as file:
+                for line in file:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1]) * 1024
+                        measured = True
+                        break
+        except (OSError, ValueError):
+            pass
+    return total if measured else None
+
+
+# Mata los procesos de process_tree que sigan vivos. Un pid que ya terminó y fue
+# reutilizado por otro proceso no se toca: psutil compara el create_time y, sin
+# psutil, se compara el instante de inicio de /proc.
+def kill_processes(processes: list):
+    for process in processes:
+        try:
+            if psutil is not None:
+                if process.is_running():
+                    process.kill()
+                continue
+            pid, start_time = process
+            if _proc_start_time(pid) == start_time:
+                os.kill(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+        except Exception:
+            pass
+
+
+# Instante de inicio (campo 22 de /proc/<pid>/stat, en ticks desde el boot) o None.
+def _proc_start_time(pid: int):
+    try:
+        with open(f'/proc/{pid}/stat', encoding='utf-8') as file:
+            return int(file.read().rsplit(')', 1)[1].split()[19])
+    except (OSError, IndexError, ValueError):
+        return None
@@ -0,0 +1,167 @@
+import hashlib
+import os.path
+from io import BytesIO
+import numpy as np
+from PIL import Image
+
+
+# Comparación de capturas contra una imagen base (baseline). El diff es vectorizado
+# con NumPy y trabaja por tiles: se compara el hash de cada tile y solo los tiles
+# distintos se comparan pixel a pixel. Las regiones a ignorar y los recortes de un
+# elemento se obtienen de los locators (rect del elemento).
+#
+#   diff = VisualDiff()
+#   result = diff.compare_to_baseline(page, 'home', ignore=[page_home.Reloj])
+#   assert result['score'] <= 0.001, result['diff_path']
+class VisualDiff:
+
+    # Rects (relativos al viewport) de los locators y el devicePixelRatio, en un solo script.
+    RECTS_SCRIPT = """
+        var locators = arguments[0], rects = [];
+        for (var i = 0; i < locators.length; i++) {
+            var el = findBy(locators[i][0], locators[i][1]);
+            if (!el) { rects.push(null); continue; }
+            var r = el.getBoundingClientRect();
+            rects.push([r.left, r.top, r.width, r.height]);
+        }
+        return {rects: rects, ratio: window.devicePixelRatio || 1};
+    """
+
+    def __init__(self,
+                 baseline_dir: str = 'baselines',
+                 diff_dir: str = 'diffs',
+                 tile_size: int = 64,
+                 tolerance: int = 0):
+        self.baseline_dir = baseline_dir
+        self.diff_dir = diff_dir
+        self.tile_size = tile_size
+        # Diferencia máxima por canal (0-255) que todavía se considera igual.
+        self.tolerance = tolerance
+        self._baseline_hashes = {}  # ruta -> (mtime, hashes)
+
+    # Compara dos imágenes (PIL, bytes PNG o ruta). ignore_regions es una lista de
+    # (x, y, ancho, alto) en pixels. Devuelve score (fracción de pixels distintos),
+    # cantidad de pixels y tiles distintos, y la imagen de diff (o None si son iguales).
+    def compare(self, expected, actual, ignore_regions: list = (), expected_hashes=None) -> dict:
+        expected = self.__to_array(expected)
+        actual = self.__to_array(actual)
+        if expected.shape != actual.shape:
+            return {'score': 1.0, 'diff_pixels': None, 'changed_tiles': None, 'total_tiles': None,
+                    'size_mismatch': (expected.shape[1::-1], actual.shape[1::-1]), 'diff_image': None}
+
+        mask = np.ones(expected.shape[:2], dtype=bool)
+        for x, y, width, height in ignore_regions:
+            # Se recortan ambos extremos: una región fuera de la imagen no tapa nada.
+            x0, y0 = max(0, int(round(x))), max(0, int(round(y)))
+            x1, y1 = max(0, int(round(x + width))), max(0, int(round(y + height)))
+            if x1 > x0 and y1 > y0:
+                mask[y0:y1, x0:x1] = False
+        if ignore_regions:
+            expected = expected * mask[..., None]
+            actual = actual * mask[..., None]
+
+        if expected_hashes is None:
+            expected_hashes = self.tile_hashes(expected)
+        actual_hashes = self.tile_hashes(actual)
+        changed = [tile for tile, digest in actual_hashes.items() if expected_hashes.get(tile) != digest]
+
+        diff_mask = np.zeros(expected.shape[:2], dtype=bool)
+        for row, column in changed:
+            y, x = row * self.tile_size, column * self.tile_size
+            a = expected[y:y + self.tile_size, x:x + self.tile_size].astype(np.int16)
+            b = actual[y:y + self.tile_size, x:x + self.tile_size].astype(np.int16)
+            diff_mask[y:y + self.tile_size, x:x + self.tile_size] = (np.abs(a - b) > self.tolerance).any(axis=2)
+
+        diff_pixels = int(diff_mask.sum())
+        compared = int(mask.sum()) or 1
+        return {
+            'score': diff_pixels / compared,
+            'diff_pixels': diff_pixels,
+            'changed_tiles': len(changed),
+            'total_tiles': len(actual_hashes),
+            'size_mismatch': None,
+            'diff_image': self.__diff_image(actual, diff_mask) if diff_pixels else None,
+        }
+
+    # Hash por tile {(fila, columna): digest} de una imagen.
+    def tile_hashes(self, image) -> dict:
+        image = self.__to_array(image)
+        hashes = {}
+        height, width = image.shape[:2]
+        for row, y in enumerate(range(0, height, self.tile_size)):
+            for column, x in enumerate(range(0, width, self.tile_size)):
+                tile = np.ascontiguousarray(image[y:y + self.tile_size, x:x + self.tile_size])
+                hashes[(row, column)] = hashlib.blake2b(tile.data, digest_size=16).digest()
+        return hashes
+
+    # Captura la página (o solo el elemento locator) y la compara con la baseline
+    # name; las regiones de los locators de ignore no se comparan. Si no existe
+    # baseline la crea. El diff se guarda en diff_dir cuando hay diferencias.
+    def compare_to_baseline(self, page, name: str, locator=None, ignore: list = ()) -> dict:
+        locators = ([locator] if locator is not None else []) + list(ignore)
+        # Los rects se miden en el documento actual, relativos a la captura de la ventana.
+        if any(len(item) == 3 for item in locators):
+            raise ValueError("compare_to_baseline no admite locators de in_context (frames/ventanas).")
+        png = page.get_screenshot_as_png()
+        rects, ratio = [], 1
+        if locators:
+            info = page.driver.execute_script(page.FIND_BY_SCRIPT + self.RECTS_SCRIPT,
+                                              [list(item) for item in locators])
+            rects, ratio = info['rects'], info['ratio']
+        image = Image.open(BytesIO(png)).convert('RGB')
+
+        offset_x = offset_y = 0
+        if locator is not None:
+            if rects[0] is None:
+                raise ValueError(f"No se encontró el elemento del locator: {locator}.")
+            x, y, width, height = [value * ratio for value in rects[0]]
+            image = image.crop((round(x), round(y), round(x + width), round(y + height)))
+            offset_x, offset_y = x, y
+            rects = rects[1:]
+        ignore_regions = [(x * ratio - offset_x, y * ratio - offset_y, width * ratio, height * ratio)
+                          for x, y, width, height in (rect for rect in rects if rect is not None)]
+
+        baseline_path = os.path.join(self.baseline_dir, name + '.png')
+        if not os.path.exists(baseline_path):
+            os.makedirs(self.baseline_dir, exist_ok=True)
+            image.save(baseline_path)
+            return {'score': 0.0, 'diff_pixels': 0, 'changed_tiles': 0, 'total_tiles': None,
+                    'size_mismatch': None, 'diff_image': None, 'diff_path': None, 'new_baseline': True}
+
+        with Image.open(baseline_path) as baseline:
+            expected = self.__to_array(baseline)
+        hashes = self.__baseline_hashes(baseline_path, expected) if not ignore_regions else None
+        result = self.compare(expected, image, ignore_regions, hashes)
+        result['new_baseline'] = False
+        result['diff_path'] = None
+        if result['diff_image'] is not None:
+            os.makedirs(self.diff_dir, exist_ok=True)
+            result['diff_path'] = os.path.join(self.diff_dir, name + '_diff.png')
+            result['diff_image'].save(result['diff_path'])
+        return result
+
+    # Método privado: los hashes de cada baseline se calculan una sola vez (por mtime).
+    def __baseline_hashes(self, path: str, expected) -> dict:
+        mtime = os.path.getmtime(path)
+        cached = self._baseline_hashes.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = self._baseline_hashes[path] = (mtime, self.tile_hashes(expected))
+        return cached[1]
+
+    # Método privado: normaliza la entrada a un array RGB uint8.
+    @staticmethod
+    def __to_array(image):
+        if isinstance(image, np.ndarray):
+            return image
+        if isinstance(image, (bytes, bytearray)):
+            image = Image.open(BytesIO(image))
+        elif isinstance(image, str):
+            image = Image.open(image)
+        return np.asarray(image.convert('RGB'))
+
+    # Método privado: imagen de diff, la captura atenuada con los pixels distintos en rojo.
+    @staticmethod
+    def __diff_image(actual, diff_mask) -> Image.Image:
+        output = (actual.astype(np.uint16) // 3 + 170).astype(np.uint8)
+        output[diff_mask] = (255, 0, 0)
+        return Image.fromarray(output)
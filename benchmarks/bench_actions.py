@@ -0,0 +1,49 @@
+import argparse
+import time
+from local_site import serve_pages
+from BasePage import BasePage
+from Instrumentation import Instrumentation
+
+ITEMS = 10
+PAGE = ('<html><head><title>Actions</title><style>div { width: 80px; height: 30px; margin: 4px; '
+        'background: #ddd; }</style></head><body>'
+        + ''.join(f'<div id="item{i}" draggable="true">item {i}</div>' for i in range(ITEMS))
+        + '<div id="target" style="height: 80px; background: #9c9">target</div></body></html>')
+
+
+# Flujo de hover + drag & drop sobre ITEMS elementos, sin batch (un request por
+# acción) y con actions_batch (un solo request W3C Actions).
+def flow(page):
+    for i in range(ITEMS):
+        page.hover_over_element((BasePage.ID, f'item{i}'))
+        page.drag_and_drop((BasePage.ID, f'item{i}'), (BasePage.ID, 'target'))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--browser', default='chrome')
+    args = parser.parse_args()
+
+    with serve_pages({'index.html': PAGE}) as url:
+        page = BasePage(driver_to_use=args.browser, headless=True, cache_elements=True)
+        metrics = Instrumentation()
+        metrics.instrument(page)
+        try:
+            page.navigate_to(url + 'index.html')
+            for label, batched in (('sin batch', False), ('con batch', True)):
+                before = metrics.to_dict()['commands'].get('actions', {}).get('calls', 0)
+                start = time.perf_counter()
+                if batched:
+                    with page.actions_batch():
+                        flow(page)
+                else:
+                    flow(page)
+                elapsed = (time.perf_counter() - start) * 1000
+                after = metrics.to_dict()['commands'].get('actions', {}).get('calls', 0)
+                print(f'{label}: {elapsed:.0f} ms, {after - before} requests W3C Actions')
+        finally:
+            page.driver.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+import argparse
+import time
+from local_site import serve_pages
+from BasePage import BasePage
+
+IMAGES = 60
+SVG = ('<svg xmlns="http://www.w3.org/2000/svg" width="400" height="300">'
+       + ''.join(f'<circle cx="{i % 400}" cy="{i % 300}" r="{i % 40}" fill="#{i:06x}"/>' for i in range(2000))
+       + '</svg>')
+PAGE = ('<html><head><title>Navigation</title></head><body><h1 id="title">Catálogo</h1>'
+        + ''.join(f'<img src="img/{i}.svg">' for i in range(IMAGES))
+        + '</body></html>')
+
+
+# Compara navegar con todos los recursos contra bloquear imágenes (y con
+# page_load_strategy='eager'), informando tiempo, requests y bytes evitados.
+def run(url, browser, iterations, **kwargs):
+    page = BasePage(driver_to_use=browser, headless=True, **kwargs)
+    try:
+        elapsed = 0.0
+        for _ in range(iterations):
+            start = time.perf_counter()
+            page.navigate_to(url)
+            page.find((BasePage.ID, 'title'))
+            elapsed += time.perf_counter() - start
+        stats = page.get_network_stats()
+        return elapsed / iterations, stats
+    finally:
+        page.driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--browser', default='chrome')
+    parser.add_argument('--iterations', type=int, default=10)
+    args = parser.parse_args()
+
+    pages = {'index.html': PAGE}
+    pages.update({f'img/{i}.svg': SVG for i in range(IMAGES)})
+    with serve_pages(pages) as url:
+        base_time, base = run(url + 'index.html', args.browser, args.iterations)
+        blocked_time, blocked = run(url + 'index.html', args.browser, args.iterations,
+                                    block_resources=('image',), page_load_strategy='eager')
+    print(f'sin bloqueo: {base_time * 1000:.0f} ms, {base["requests"]} requests, {base["transferred_bytes"]} bytes')
+    print(f'con bloqueo: {blocked_time * 1000:.0f} ms, {blocked["requests"]} requests, {blocked["transferred_bytes"]} bytes')
+    print(f'evitados: {base["requests"] - blocked["requests"]} requests, '
+          f'{base["transferred_bytes"] - blocked["transferred_bytes"]} bytes '
+          f'(bloqueados según el driver: {blocked["blocked_requests"]})')
+
+
+if __name__ == '__main__':
+    main()
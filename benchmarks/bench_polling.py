@@ -0,0 +1,48 @@
+import argparse
+import random
+import statistics
+import time
+from local_site import serve_pages
+from BasePage import BasePage
+
+# El elemento #target aparece luego de ?delay=ms.
+PAGE = """<html><head><title>Polling</title></head><body>
+<script>
+var delay = parseInt(new URLSearchParams(location.search).get('delay') || '0', 10);
+setTimeout(function () {
+    var div = document.createElement('div');
+    div.id = 'target';
+    div.textContent = 'ready';
+    document.body.appendChild(div);
+}, delay);
+</script>
+</body></html>"""
+
+
+# Compara el tiempo medio hasta obtener el elemento con cada política de polling
+# (None = WebDriverWait con poll de 0.5 seg.).
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--browser', default='chrome')
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    delays = [random.Random(i).randint(20, 400) for i in range(args.iterations)]
+    with serve_pages({'index.html': PAGE}) as url:
+        page = BasePage(driver_to_use=args.browser, headless=True)
+        try:
+            for polling in (None, 'backoff', 'observer'):
+                latencies = []
+                for delay in delays:
+                    page.navigate_to(f'{url}index.html?delay={delay}')
+                    start = time.perf_counter()
+                    page.find((BasePage.ID, 'target'), polling=polling)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                print(f'{str(polling):>8}: media {statistics.mean(latencies):7.1f} ms, '
+                      f'max {max(latencies):7.1f} ms')
+        finally:
+            page.driver.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+import argparse
+import os.path
+import statistics
+import subprocess
+import sys
+import time
+import local_site  # noqa: F401  (agrega la raíz del repo al sys.path)
+from BasePage import BasePage
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Mide el tiempo de "import BasePage" en un proceso nuevo, el costo de construir un
+# page (sin browser) y la latencia del primer comando (que lanza el browser).
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--browser', default='chrome')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--no-browser', action='store_true', help='solo mide import y constructor')
+    args = parser.parse_args()
+
+    code = 'import time; t = time.perf_counter(); import BasePage; print(time.perf_counter() - t)'
+    imports = [float(subprocess.check_output([sys.executable, '-c', code], cwd=ROOT)) * 1000
+               for _ in range(args.runs)]
+    print(f'import BasePage: mediana {statistics.median(imports):.1f} ms')
+
+    start = time.perf_counter()
+    page = BasePage(driver_to_use=args.browser, headless=True)
+    print(f'BasePage(): {(time.perf_counter() - start) * 1000:.2f} ms (browser iniciado: {page.has_driver()})')
+
+    if not args.no_browser:
+        start = time.perf_counter()
+        page.navigate_to('about:blank')
+        print(f'primer comando (incluye iniciar el browser): {(time.perf_counter() - start) * 1000:.0f} ms')
+        page.driver.quit()
+
+
+if __name__ == '__main__':
+    main()
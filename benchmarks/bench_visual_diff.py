@@ -0,0 +1,41 @@
+import argparse
+import time
+import numpy as np
+import local_site  # noqa: F401  (agrega la raíz del repo al sys.path)
+from VisualDiff import VisualDiff
+
+
+# Compara imágenes full-HD sintéticas: idénticas, con un cambio chico y con muchos
+# cambios, contra un loop por pixel en Python (estimado sobre una franja).
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    baseline = rng.integers(0, 255, (1080, 1920, 3), dtype=np.uint8)
+    small_change = baseline.copy()
+    small_change[500:540, 900:1000] = 0
+    noisy = baseline.copy()
+    noisy[::7, ::5] = 255
+
+    diff = VisualDiff()
+    hashes = diff.tile_hashes(baseline)
+    for label, image in (('idénticas', baseline.copy()), ('cambio chico', small_change), ('muchos cambios', noisy)):
+        start = time.perf_counter()
+        for _ in range(args.runs):
+            result = diff.compare(baseline, image, expected_hashes=hashes)
+        elapsed = (time.perf_counter() - start) / args.runs * 1000
+        print(f'{label:>15}: {elapsed:7.1f} ms, score {result["score"]:.5f}, '
+              f'tiles {result["changed_tiles"]}/{result["total_tiles"]}')
+
+    rows = 20
+    start = time.perf_counter()
+    a, b = baseline[:rows].tolist(), small_change[:rows].tolist()
+    different = sum(1 for y in range(rows) for x in range(1920) if a[y][x] != b[y][x])
+    per_row = (time.perf_counter() - start) / rows
+    print(f'{"loop en Python":>15}: {per_row * 1080 * 1000:7.1f} ms estimados ({different} pixels en la franja)')
+
+
+if __name__ == '__main__':
+    main()
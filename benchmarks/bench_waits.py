@@ -0,0 +1,46 @@
+import argparse
+import time
+from local_site import serve_pages
+from BasePage import BasePage
+
+PAGE = """<html><head><title>Bench</title></head><body>
+<h1>Screenshot bench</h1>
+<button id="open" onclick="setTimeout(function () { window.open('popup.html'); }, 200)">open</button>
+</body></html>"""
+
+
+# Compara el sleep fijo anterior (3 seg. por captura, 2 seg. por cambio de ventana)
+# contra las esperas por condición de wait_for_page_ready / wait_for_window.
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--browser', default='chrome')
+    parser.add_argument('--screenshots', type=int, default=10)
+    args = parser.parse_args()
+
+    with serve_pages({'index.html': PAGE, 'popup.html': '<html><body>popup</body></html>'}) as url:
+        page = BasePage(driver_to_use=args.browser, headless=True)
+        try:
+            page.navigate_to(url + 'index.html')
+
+            start = time.perf_counter()
+            for _ in range(args.screenshots):
+                time.sleep(3)
+                page.driver.get_screenshot_as_png()
+            fixed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(args.screenshots):
+                page.get_screenshot_as_png()
+            conditional = time.perf_counter() - start
+            print(f'screenshots x{args.screenshots}: sleep fijo {fixed:.2f}s, por condición {conditional:.2f}s')
+
+            page.click_element((BasePage.ID, 'open'))
+            start = time.perf_counter()
+            page.switch_to_window(-1)
+            print(f'switch_to_window (popup a los 200ms): {time.perf_counter() - start:.2f}s vs 2.00s fijo')
+        finally:
+            page.driver.quit()
+
+
+if __name__ == '__main__':
+    main()
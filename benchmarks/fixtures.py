@@ -0,0 +1,57 @@
+# Páginas generadas para los benchmarks: tabla grande, select enorme, iframes
+# anidados y elementos que aparecen con demora.
+
+TABLE_ROWS = 500
+TABLE_COLUMNS = 10
+SELECT_OPTIONS = 2000
+FRAME_DEPTH = 3
+
+
+def table_page(rows: int = TABLE_ROWS, columns: int = TABLE_COLUMNS) -> str:
+    body = ''.join('<tr>' + ''.join(f'<td>r{r}c{c}</td>' for c in range(1, columns + 1)) + '</tr>'
+                   for r in range(1, rows + 1))
+    return f'<html><head><title>Tabla</title></head><body><div id="grid"><table><tbody>{body}</tbody></table></div></body></html>'
+
+
+def select_page(options: int = SELECT_OPTIONS) -> str:
+    items = ''.join(f'<option value="p{i}">País {i}</option>' for i in range(options))
+    return f'<html><head><title>Select</title></head><body><select id="pais">{items}</select></body></html>'
+
+
+def delayed_page() -> str:
+    return """<html><head><title>Demora</title></head><body><script>
+var delay = parseInt(new URLSearchParams(location.search).get('delay') || '0', 10);
+setTimeout(function () {
+    var div = document.createElement('div');
+    div.id = 'target';
+    div.textContent = 'listo';
+    document.body.appendChild(div);
+}, delay);
+</script></body></html>"""
+
+
+# frame0.html contiene un iframe a frame1.html, ... hasta depth; el último tiene #deep.
+def frame_pages(depth: int = FRAME_DEPTH) -> dict:
+    pages = {}
+    for level in range(depth):
+        pages[f'frame{level}.html'] = (f'<html><body><p>nivel {level}</p>'
+                                       f'<iframe id="frame{level + 1}" src="frame{level + 1}.html"></iframe></body></html>')
+    pages[f'frame{depth}.html'] = '<html><body><button id="deep">profundo</button></body></html>'
+    pages['frames.html'] = '<html><head><title>Frames</title></head><body><iframe id="frame0" src="frame0.html"></iframe></body></html>'
+    return pages
+
+
+def index_page() -> str:
+    links = ''.join(f'<li><a href="{name}">{name}</a></li>' for name in ('table.html', 'select.html', 'frames.html'))
+    return f'<html><head><title>Inicio</title></head><body><h1 id="title">Benchmarks</h1><ul>{links}</ul></body></html>'
+
+
+def all_pages() -> dict:
+    pages = {
+        'index.html': index_page(),
+        'table.html': table_page(),
+        'select.html': select_page(),
+        'delayed.html': delayed_page(),
+    }
+    pages.update(frame_pages())
+    return pages
@@ -0,0 +1,35 @@
+import functools
+import http.server
+import os.path
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Levanta un http.server local con las páginas indicadas ({nombre: html}) y
+# devuelve la URL base. Se usa en los benchmarks para no depender de sandbox-auto.
+@contextmanager
+def serve_pages(pages: dict):
+    with tempfile.TemporaryDirectory() as directory:
+        for name, html in pages.items():
+            path = os.path.join(directory, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(html)
+        handler = functools.partial(QuietHandler, directory=directory)
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            yield f'http://127.0.0.1:{server.server_port}/'
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
@@ -0,0 +1,125 @@
+import argparse
+import json
+import os.path
+import sys
+import time
+from local_site import serve_pages
+import fixtures
+from BasePage import BasePage
+from Instrumentation import Instrumentation
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEEP = BasePage.in_context((BasePage.ID, 'deep'),
+                           *[(BasePage.ID, f'frame{level}') for level in range(fixtures.FRAME_DEPTH + 1)])
+GRID = (BasePage.XPATH, '//*[@id="grid"]')
+PAIS = (BasePage.ID, 'pais')
+
+
+# Escenarios: (nombre, página a abrir antes de medir, función medida, iteraciones).
+# La página se abre una sola vez salvo en los escenarios de navegación.
+SCENARIOS = [
+    ('navigate_to', None, lambda page, url: page.navigate_to(url + 'index.html'), 20),
+    ('find_delayed', None, lambda page, url: (page.navigate_to(url + 'delayed.html?delay=150'),
+                                              page.find((BasePage.ID, 'target'))), 10),
+    ('find_nested_iframe', 'frames.html', lambda page, url: (page.switch_to_default_content(),
+                                                             page.find(DEEP)), 20),
+    ('get_value_from_table', 'table.html', lambda page, url: page.get_value_from_table(GRID, 250, 5), 20),
+    ('get_table', 'table.html', lambda page, url: page.get_table(GRID), 10),
+    ('verify_item_in_dropdown', 'select.html', lambda page, url: page.verify_item_in_dropdown(PAIS, 'País 1999'), 3),
+    ('verify_item_in_dropdown_fast', 'select.html',
+     lambda page, url: page.verify_item_in_dropdown_fast(PAIS, 'País 1999'), 20),
+    ('get_screenshot_as_png', 'index.html', lambda page, url: page.get_screenshot_as_png(), 10),
+]
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def command_calls(metrics: Instrumentation) -> int:
+    return sum(stats['calls'] for stats in metrics.to_dict()['commands'].values())
+
+
+# Corre los escenarios y devuelve {nombre: {p50, p90, p95, max (ms), round_trips}}.
+def run(browser: str, only: list = None) -> dict:
+    results = {}
+    with serve_pages(fixtures.all_pages()) as url:
+        page = BasePage(driver_to_use=browser, headless=True)
+        metrics = Instrumentation()
+        metrics.instrument(page)
+        try:
+            for name, setup, scenario, iterations in SCENARIOS:
+                if only and name not in only:
+                    continue
+                if setup:
+                    page.navigate_to(url + setup)
+                latencies = []
+                before = command_calls(metrics)
+                for _ in range(iterations):
+                    start = time.perf_counter()
+                    scenario(page, url)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                results[name] = {
+                    'iterations': iterations,
+                    'p50': percentile(latencies, 0.5),
+                    'p90': percentile(latencies, 0.9),
+                    'p95': percentile(latencies, 0.95),
+                    'max': max(latencies),
+                    'round_trips': (command_calls(metrics) - before) / iterations,
+                }
+        finally:
+            page.driver.quit()
+    return results
+
+
+# Compara contra la baseline: regresión si p50 supera la baseline en más de
+# tolerance (fracción) o si aumentan los round-trips por iteración.
+def find_regressions(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current['p50'] > previous['p50'] * (1 + tolerance):
+            regressions.append(f"{name}: p50 {current['p50']:.1f} ms > baseline {previous['p50']:.1f} ms")
+        if current['round_trips'] > previous['round_trips']:
+            regressions.append(f"{name}: round-trips {current['round_trips']:.1f} > baseline {previous['round_trips']:.1f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks de BasePage contra un sitio local.')
+    parser.add_argument('--browser', default='chrome')
+    parser.add_argument('--only', nargs='*', help='escenarios a correr')
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help='guarda los resultados como baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--output', help='guarda los resultados en JSON')
+    args = parser.parse_args()
+
+    results = run(args.browser, args.only)
+    for name, stats in results.items():
+        print(f"{name:>30}: p50 {stats['p50']:8.1f} ms  p90 {stats['p90']:8.1f} ms  "
+              f"p95 {stats['p95']:8.1f} ms  max {stats['max']:8.1f} ms  round-trips {stats['round_trips']:6.1f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+        print(f'Baseline guardada en {args.baseline}')
+        return 0
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as file:
+            regressions = find_regressions(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f'REGRESIÓN {regression}')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
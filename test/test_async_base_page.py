@@ -0,0 +1,78 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from AsyncBasePage import AsyncBasePage
+
+
+# Elemento y driver falsos: find_element tarda delay seg. y registra cuántas
+# llamadas corren a la vez sobre el mismo driver.
+class FakeElement:
+
+    def is_displayed(self):
+        return True
+
+
+class FakeDriver:
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def set_page_load_timeout(self, timeout):
+        pass
+
+    def find_element(self, by, value):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return FakeElement()
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        yield executor
+
+
+def test_sessions_find_concurrently(executor):
+    async def scenario():
+        pages = [await AsyncBasePage.create(FakeDriver(), executor=executor) for _ in range(4)]
+        start = time.perf_counter()
+        elements = await asyncio.gather(*(page.find(('id', 'x')) for page in pages))
+        return elements, time.perf_counter() - start
+
+    elements, elapsed = asyncio.run(scenario())
+    assert all(isinstance(element, FakeElement) for element in elements)
+    assert elapsed < 0.6
+
+
+def test_calls_on_one_session_are_serialized(executor):
+    driver = FakeDriver(delay=0.05)
+
+    async def scenario():
+        page = await AsyncBasePage.create(driver, executor=executor)
+        await asyncio.gather(*(page.find(('id', str(n))) for n in range(4)))
+
+    asyncio.run(scenario())
+    assert driver.max_active == 1
+
+
+def test_session_released_after_timeout(executor):
+    driver = FakeDriver(delay=0.3)
+
+    async def scenario():
+        page = await AsyncBasePage.create(driver, executor=executor)
+        with pytest.raises(asyncio.TimeoutError):
+            await page.find(('id', 'slow'), timeout=0.05)
+        # El comando abandonado termina en su thread y recién ahí se libera la sesión.
+        return await page.find(('id', 'next'), timeout=2)
+
+    assert isinstance(asyncio.run(scenario()), FakeElement)
+    assert driver.max_active == 1
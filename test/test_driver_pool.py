@@ -0,0 +1,78 @@
+import pytest
+from BasePage import BasePage
+from DriverPool import DriverPool
+
+
+# Driver falso con CDP: registra los comandos de limpieza sin lanzar un browser.
+class FakeDriver:
+
+    def __init__(self, *settings):
+        self.window_handles = ['main']
+        self.switch_to = self
+        self.cdp_commands = []
+        self.quit_called = False
+
+    def window(self, handle):
+        pass
+
+    def close(self):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def execute_script(self, script, *args):
+        pass
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append((command, params))
+        if command == 'Page.getNavigationHistory':
+            return {'entries': [{'url': 'https://a.test/login'}, {'url': 'about:blank'}]}
+        if command == 'Page.addScriptToEvaluateOnNewDocument':
+            return {'identifier': '7'}
+        return {}
+
+    def set_page_load_timeout(self, timeout):
+        pass
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(BasePage, 'create_driver', classmethod(lambda cls, *settings: FakeDriver(*settings)))
+    return DriverPool(max_size=1, lease_timeout=0.1)
+
+
+def test_release_rejects_unknown_and_double_release(pool):
+    driver = pool.acquire('chrome', headless=True)
+    pool.release(driver)
+    with pytest.raises(ValueError):
+        pool.release(driver)
+    with pytest.raises(ValueError):
+        pool.release(FakeDriver())
+    stats = pool.get_stats()
+    assert (stats['live'], stats['idle']) == (1, 1)
+    assert pool.acquire('chrome', headless=True) is driver
+    with pytest.raises(TimeoutError):
+        pool.acquire('chrome', headless=True)
+
+
+def test_release_clears_every_visited_origin(pool):
+    driver = pool.acquire('chrome', headless=True)
+    pool.release(driver)
+    assert ('Network.clearBrowserCookies', {}) in driver.cdp_commands
+    assert ('Storage.clearDataForOrigin', {'origin': 'https://a.test', 'storageTypes': 'all'}) in driver.cdp_commands
+
+
+def test_release_undoes_page_browser_state(pool):
+    driver = pool.acquire('chrome', headless=True)
+    page = BasePage(driver, block_resources=('image',))
+    page.enable_idle_tracking()
+    pool.release(driver)
+    assert ('Network.setBlockedURLs', {'urls': []}) in driver.cdp_commands
+    assert ('Page.removeScriptToEvaluateOnNewDocument', {'identifier': '7'}) in driver.cdp_commands
@@ -0,0 +1,54 @@
+import functools
+import http.server
+import os.path
+import shutil
+import threading
+import pytest
+from ParallelRunner import run_parallel
+
+
+# Page falso: no lanza browser y deja una marca en disco al cerrarse.
+class FakePage:
+
+    def __init__(self, marks_dir, headless=True):
+        self.marks_dir = marks_dir
+
+    def close_browser(self):
+        with open(os.path.join(self.marks_dir, f'closed_{os.getpid()}'), 'w'):
+            pass
+
+
+# Escenario para run_parallel: devuelve el pid del worker.
+def worker_pid(page):
+    return os.getpid()
+
+
+# Escenario para run_parallel: abre el sitio local y devuelve el título.
+def open_local_site(page, url):
+    page.navigate_to(url)
+    return page.get_title()
+
+
+def test_run_parallel_closes_every_worker_page(tmp_path):
+    report = run_parallel([worker_pid] * 6, workers=2, page_class=FakePage,
+                          page_kwargs={'marks_dir': str(tmp_path)}, screenshots_dir=str(tmp_path))
+    assert report['failed'] == 0
+    pids = {result['result'] for result in report['results']}
+    assert {f'closed_{pid}' for pid in pids} <= set(os.listdir(tmp_path))
+
+
+@pytest.mark.skipif(not any(shutil.which(name) for name in ('google-chrome', 'chromium', 'chromium-browser', 'chrome')),
+                    reason='Chrome no está instalado')
+def test_run_parallel_local_site(tmp_path):
+    (tmp_path / 'index.html').write_text('<html><head><title>Local</title></head><body></body></html>')
+    handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=str(tmp_path))
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_port}/index.html'
+    try:
+        report = run_parallel([functools.partial(open_local_site, url=url)] * 4, workers=2,
+                              screenshots_dir=str(tmp_path / 'screenshots'))
+    finally:
+        server.shutdown()
+    assert report['failed'] == 0
+    assert all(result['result'] == 'Local' for result in report['results'])
@@ -0,0 +1,15 @@
+import numpy as np
+from VisualDiff import VisualDiff
+
+
+def test_ignore_regions_outside_image_do_not_mask_edges():
+    expected = np.zeros((120, 320, 3), dtype=np.uint8)
+    actual = expected.copy()
+    actual[95:115, 0:5] = 255      # cambio real en el borde izquierdo
+    diff = VisualDiff(tile_size=16)
+    # Región completamente a la izquierda de la imagen: no debe ocultar el cambio.
+    result = diff.compare(expected, actual, ignore_regions=[(-300, 95, 215, 20)])
+    assert result['diff_pixels'] == 100
+    # Región que sobresale por la izquierda: solo tapa la parte visible.
+    result = diff.compare(expected, actual, ignore_regions=[(-10, 95, 13, 20)])
+    assert result['diff_pixels'] == 40